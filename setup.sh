@@ -10,7 +10,7 @@ echo -e "${BLUE}Setting up Window Manager Project...${NC}"
 
 # Check Python version
 if ! command -v python >/dev/null 2>&1; then
-    echo -e "${RED}Python is not installed. Please install Python 3.8 or higher.${NC}"
+    echo -e "${RED}Python is not installed. Please install Python 3.10 or higher.${NC}"
     exit 1
 fi
 
@@ -154,7 +154,7 @@ A modern window management tool for Windows with multi-monitor and ultrawide sup
 
 ## Requirements
 
-- Python 3.8 or higher
+- Python 3.10 or higher
 - Visual Studio Build Tools with Windows 10 SDK
 - Git Bash (for Windows)
 
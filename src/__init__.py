@@ -28,26 +28,131 @@ CONFIG_DIR = os.path.join(src_dir, 'config')
 ASSETS_DIR = os.path.join(src_dir, 'assets')
 PROFILES_DIR = os.path.join(CONFIG_DIR, 'profiles')
 
-# Ensure required directories exist
-os.makedirs(CONFIG_DIR, exist_ok=True)
-os.makedirs(PROFILES_DIR, exist_ok=True)
-
-# Import core components
-from .core import *
-from .models import *
-from .components import *
-from .utils import *
-
-# Initialize logging
-import logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(os.path.join(CONFIG_DIR, 'window_manager.log')),
-        logging.StreamHandler()
-    ]
-)
-
-# Global logger instance
-logger = logging.getLogger('window_manager')
\ No newline at end of file
+
+def ensure_directories():
+    """Create the config and profiles directories if they are missing.
+
+    Called by code that actually writes config/profiles; importing the
+    package performs no filesystem work.
+    """
+    for path in (CONFIG_DIR, PROFILES_DIR):
+        if not os.path.exists(path):
+            os.makedirs(path, exist_ok=True)
+
+# Lazy subpackage exports (PEP 562). Importing the package no longer pulls
+# in PyQt5 and the win32 modules until an exported name is actually used.
+_LAZY_IMPORTS = {
+    # Core
+    'LayerManager': '.core',
+    'MonitorProfileManager': '.core',
+    'UltrawideGridSystem': '.core',
+    'WindowAnimator': '.core',
+    'AppManager': '.core',
+    'TempLayoutManager': '.core',
+
+    # Models
+    'Layer': '.models',
+    'MonitorInfo': '.models',
+    'MonitorGridConfig': '.models',
+    'WindowInfo': '.models',
+    'AppState': '.models',
+    'TempLayout': '.models',
+
+    # Components
+    'FloatingActionButton': '.components',
+    'GridOverlay': '.components',
+    'PreviewRect': '.components',
+    'LayoutStatusIndicator': '.components',
+    'UnsavedDialog': '.components',
+
+    # Utilities
+    'is_valid_window': '.utils',
+    'get_window_info': '.utils',
+    'get_monitor_info': '.utils',
+    'set_window_position': '.utils',
+    'get_window_state': '.utils',
+    'set_window_state': '.utils',
+    'find_executable_path': '.utils',
+    'get_steam_app_path': '.utils',
+    'get_start_menu_entries': '.utils',
+    'resolve_shortcut': '.utils',
+    'is_admin_required': '.utils',
+    'get_running_apps': '.utils',
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name):
+    """Resolve exported names lazily on first access."""
+    if name == 'logger':
+        return get_logger()
+
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+# Logging is configured lazily: importing the package must not create
+# directories or open the log file. Use get_logger() (or the module's
+# `logger` attribute, resolved through __getattr__) instead.
+_logger = None
+
+
+def get_logger():
+    """Get the application logger, configuring handlers on first use."""
+    global _logger
+    if _logger is None:
+        import atexit
+        import logging
+        import logging.handlers
+
+        ensure_directories()
+
+        # Buffer file writes: records hit disk in batches of up to 256,
+        # immediately on ERROR or worse, and on clean shutdown.
+        file_handler = logging.FileHandler(
+            os.path.join(CONFIG_DIR, 'window_manager.log')
+        )
+        # MemoryHandler delegates formatting to its target, so the format
+        # has to be set on the file handler directly.
+        file_handler.setFormatter(logging.Formatter(
+            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        ))
+        buffered_handler = logging.handlers.MemoryHandler(
+            capacity=256,
+            flushLevel=logging.ERROR,
+            target=file_handler,
+            flushOnClose=True
+        )
+        atexit.register(buffered_handler.flush)
+
+        logging.basicConfig(
+            level=logging.INFO,
+            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+            handlers=[
+                buffered_handler,
+                logging.StreamHandler()
+            ]
+        )
+        _logger = logging.getLogger('window_manager')
+    return _logger
+
+
+def dlog(msg_fn, *args):
+    """Log a debug message without paying for formatting when DEBUG is off.
+
+    Call sites pass a callable producing the message, e.g.
+    ``dlog(lambda g: f"grid={g!r}", grid_system)``, so expensive reprs and
+    f-strings are only evaluated when debug logging is enabled. For cheap
+    messages, plain ``logger.debug("grid=%s", g)`` deferred formatting is
+    equally fine.
+    """
+    import logging
+    log = get_logger()
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug(msg_fn(*args))
\ No newline at end of file
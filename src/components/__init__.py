@@ -5,19 +5,29 @@ This module contains all UI-related components for the window management system.
 Each component is designed to be self-contained and reusable.
 """
 
-from .floating_button import FloatingActionButton
-from .grid_overlay import GridOverlay
-from .preview_rect import PreviewRect
-from .layout_status_indicator import LayoutStatusIndicator
-from .unsaved_dialog import UnsavedDialog
+# Lazy component exports (PEP 562): each widget module is imported on
+# first attribute access instead of at package import time.
+_LAZY_IMPORTS = {
+    'FloatingActionButton': '.floating_button',
+    'GridOverlay': '.grid_overlay',
+    'PreviewRect': '.preview_rect',
+    'LayoutStatusIndicator': '.layout_status_indicator',
+    'UnsavedDialog': '.unsaved_dialog',
+}
 
-__all__ = [
-    'FloatingActionButton',
-    'GridOverlay',
-    'PreviewRect',
-    'LayoutStatusIndicator',
-    'UnsavedDialog'
-]
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name):
+    """Resolve component classes lazily on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
 
 # Component configuration defaults
 DEFAULT_FAB_SIZE = 56
@@ -1,6 +1,6 @@
-from PyQt5.QtWidgets import QWidget, QGraphicsDropShadowEffect, QApplication
-from PyQt5.QtCore import QRectF, Qt, QPropertyAnimation, QEasingCurve, QRect, QPoint, pyqtSignal, QSize
-from PyQt5.QtGui import QPainter, QPainterPath, QColor, QPen, QFont
+from PyQt5.QtWidgets import QWidget, QApplication
+from PyQt5.QtCore import QRectF, Qt, QPropertyAnimation, QVariantAnimation, QEasingCurve, QRect, QPoint, pyqtSignal, QTimer
+from PyQt5.QtGui import QPainter, QColor, QPen, QFont, QPixmap, QPolygon
 
 class FloatingActionButton(QWidget):
     """Material Design-style floating action button."""
@@ -19,15 +19,23 @@ class FloatingActionButton(QWidget):
         self.is_pressed = False
         self.drag_start = None
         self.hover = False
+
+        # Drag throttling (coalesce mouse moves to ~60Hz)
+        self._drag_screen_rect = None
+        self._pending_pos = None
+        self._drag_timer = QTimer(self)
+        self._drag_timer.setInterval(16)
+        self._drag_timer.timeout.connect(self._apply_pending_move)
         self.text = text
         self.font = QFont("Arial", 14, QFont.Bold)
+        self._pixmaps = {}  # Visual state -> pre-rendered QPixmap
+        self._inner_rect = self.rect().adjusted(4, 4, -4, -4)  # Padded circle bounds
+        self._dot_points = self._build_dot_points()
 
-        # Setup shadow effect
-        self.shadow = QGraphicsDropShadowEffect(self)
-        self.shadow.setBlurRadius(15)
-        self.shadow.setOffset(0, 2)
-        self.shadow.setColor(QColor(0, 0, 0, 80))
-        self.setGraphicsEffect(self.shadow)
+        # Shadow is baked into the cached state pixmaps instead of using
+        # QGraphicsDropShadowEffect, which would re-rasterize the widget
+        # offscreen and blur it on every repaint
+        self.shadow_color = QColor(0, 0, 0, 80)
 
         # Colors
         self.base_color = QColor(65, 65, 65)
@@ -36,10 +44,15 @@ class FloatingActionButton(QWidget):
         self.icon_color = QColor(icon_color)
         self.text_color = QColor(255, 255, 255)
 
-        # Setup hover animation
-        self.hover_animation = QPropertyAnimation(self, b"size")
-        self.hover_animation.setDuration(150)
-        self.hover_animation.setEasingCurve(QEasingCurve.OutCubic)
+        # Setup hover animation: a painted scale factor instead of resizing
+        # the widget, so hovering never triggers resizeEvent/pixmap rebuilds
+        self._hover_scale = 1.0
+        self._scale_anim = QVariantAnimation(self)
+        self._scale_anim.setStartValue(1.0)
+        self._scale_anim.setEndValue(1.07)
+        self._scale_anim.setDuration(150)
+        self._scale_anim.setEasingCurve(QEasingCurve.OutCubic)
+        self._scale_anim.valueChanged.connect(self._on_hover_scale)
 
         # Position animation
         self.move_animation = QPropertyAnimation(self, b"geometry")
@@ -47,53 +60,104 @@ class FloatingActionButton(QWidget):
         self.move_animation.setEasingCurve(QEasingCurve.OutCubic)
         self.move_animation.finished.connect(self._on_move_finished)
 
-    def paintEvent(self, event):
-        """Draw the button and its text/icon."""
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
+    def _build_dot_points(self) -> QPolygon:
+        """Precompute the 3x3 grid-dot icon points for the current size."""
+        center = self._inner_rect.center()
+        icon_size = self.width() * 0.4  # 40% of button size
+        dot_spacing = icon_size / 2
+        return QPolygon([
+            QPoint(int(center.x() - icon_size / 2 + i * dot_spacing),
+                   int(center.y() - icon_size / 2 + j * dot_spacing))
+            for i in range(3) for j in range(3)
+        ])
+
+    def _rebuild_pixmaps(self):
+        """Pre-render the button background and icon for each visual state."""
+        self._pixmaps = {}
+
+        for state, bg_color in (('base', self.base_color),
+                                ('hover', self.hover_color),
+                                ('press', self.press_color)):
+            pixmap = QPixmap(self.size())
+            pixmap.fill(Qt.transparent)
+
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.Antialiasing)
+
+            rect = self._inner_rect
+            painter.setPen(Qt.NoPen)
+
+            # Draw a soft baked shadow inside the padding ring, offset down
+            shadow = QColor(self.shadow_color)
+            for i in range(4, 0, -1):
+                shadow.setAlpha(self.shadow_color.alpha() // (i + 1))
+                painter.setBrush(shadow)
+                painter.drawEllipse(QRectF(rect.adjusted(-i, -i + 2, i, i + 2)))
+
+            # Draw circular background directly, no intermediate path
+            painter.setBrush(bg_color)
+            painter.drawEllipse(QRectF(rect))
+
+            # Draw text/icon
+            if self.text:
+                painter.setFont(self.font)
+                painter.setPen(QPen(self.text_color))
+                painter.drawText(self.rect(), Qt.AlignCenter, self.text)
+            else:
+                # Default grid dots as icon, drawn in one batched call
+                painter.setPen(QPen(self.icon_color, 2))
+                painter.drawPoints(self._dot_points)
+
+            painter.end()
+            self._pixmaps[state] = pixmap
 
-        # Draw circular background
-        path = QPainterPath()
-        rect = self.rect().adjusted(4, 4, -4, -4)  # Add padding
-        path.addEllipse(QRectF(rect))  # Convert QRect to QRectF
+    def paintEvent(self, event):
+        """Draw the button by blitting the pre-rendered state pixmap."""
+        if not self._pixmaps:
+            self._rebuild_pixmaps()
 
         if self.is_pressed:
-            painter.fillPath(path, self.press_color)
+            state = 'press'
+        elif self.underMouse():
+            state = 'hover'
         else:
-            painter.fillPath(path, self.hover_color if self.underMouse() else self.base_color)
+            state = 'base'
 
-        # Draw text/icon
-        if self.text:
-            painter.setFont(self.font)
-            painter.setPen(QPen(self.text_color))
-            painter.drawText(self.rect(), Qt.AlignCenter, self.text)
-        else:
-            # Default grid dots as icon
-            center = rect.center()
-            icon_size = self.width() * 0.4  # 40% of button size
-
-            # Draw grid dots
-            dot_spacing = icon_size / 2
-            for i in range(3):
-                for j in range(3):
-                    x = center.x() - icon_size / 2 + i * dot_spacing
-                    y = center.y() - icon_size / 2 + j * dot_spacing
-                    painter.drawPoint(int(x), int(y))
+        painter = QPainter(self)
+
+        if self._hover_scale != 1.0:
+            painter.setRenderHint(QPainter.SmoothPixmapTransform)
+            center = self.rect().center()
+            painter.translate(center)
+            painter.scale(self._hover_scale, self._hover_scale)
+            painter.translate(-center)
+
+        painter.drawPixmap(0, 0, self._pixmaps[state])
+
+    def _on_hover_scale(self, value):
+        """Apply an animated hover scale step."""
+        self._hover_scale = value
+        self.update()
+
+    def resizeEvent(self, event):
+        """Re-render state pixmaps when the button size changes."""
+        super().resizeEvent(event)
+        self._inner_rect = self.rect().adjusted(4, 4, -4, -4)
+        self._dot_points = self._build_dot_points()
+        self._pixmaps.clear()
 
     def enterEvent(self, event):
         """Handle mouse enter event."""
         self.hover = True
-        self.hover_animation.setStartValue(self.size())
-        self.hover_animation.setEndValue(self.size() + QSize(4, 4))
-        self.hover_animation.start()
+        self._scale_anim.setDirection(QVariantAnimation.Forward)
+        self._scale_anim.start()
         self.update()
 
     def leaveEvent(self, event):
         """Handle mouse leave event."""
         self.hover = False
-        self.hover_animation.setStartValue(self.size())
-        self.hover_animation.setEndValue(QSize(self.width(), self.height()))
-        self.hover_animation.start()
+        self._scale_anim.setDirection(QVariantAnimation.Backward)
+        self._scale_anim.start()
         self.update()
 
     def mousePressEvent(self, event):
@@ -101,33 +165,55 @@ class FloatingActionButton(QWidget):
         if event.button() == Qt.LeftButton:
             self.is_pressed = True
             self.drag_start = event.globalPos()
+            # Cache screen bounds for the duration of the drag
+            self._drag_screen_rect = QApplication.primaryScreen().geometry()
+            self._pending_pos = None
             self.update()
 
     def mouseReleaseEvent(self, event):
         """Handle mouse release for click."""
         if event.button() == Qt.LeftButton:
             self.is_pressed = False
+            self._drag_timer.stop()
+            self._apply_pending_move()
             if self.rect().contains(event.pos()):
                 self.clicked.emit()
             self.drag_start = None
+            self._drag_screen_rect = None
             self.update()
 
     def mouseMoveEvent(self, event):
         """Handle dragging the button."""
         if self.drag_start:
             delta = event.globalPos() - self.drag_start
-            new_pos = self.pos() + delta
+            # Track from the pending position so coalesced deltas accumulate
+            base_pos = self._pending_pos if self._pending_pos is not None else self.pos()
+            new_pos = base_pos + delta
 
             # Keep button within screen bounds
-            screen = QApplication.primaryScreen().geometry()
+            screen = self._drag_screen_rect or QApplication.primaryScreen().geometry()
             new_pos.setX(max(0, min(new_pos.x(), screen.width() - self.width())))
             new_pos.setY(max(0, min(new_pos.y(), screen.height() - self.height())))
 
-            self.move(new_pos)
             self.drag_start = event.globalPos()
-            
-            # Emit moved signal with new position
-            self.moved.emit(new_pos)
+
+            # Coalesce moves; applied on the next timer tick
+            self._pending_pos = new_pos
+            if not self._drag_timer.isActive():
+                self._drag_timer.start()
+
+    def _apply_pending_move(self):
+        """Apply the latest coalesced drag position."""
+        if self._pending_pos is None:
+            self._drag_timer.stop()
+            return
+
+        new_pos = self._pending_pos
+        self._pending_pos = None
+        self.move(new_pos)
+
+        # Emit moved signal with new position
+        self.moved.emit(new_pos)
 
     def moveEvent(self, event):
         """Handle any movement of the button."""
@@ -146,11 +232,13 @@ class FloatingActionButton(QWidget):
             self.press_color = QColor(press)
         if text:
             self.text_color = QColor(text)
+        self._pixmaps.clear()
         self.update()
 
     def set_text(self, text: str):
         """Set the button's text."""
         self.text = text
+        self._pixmaps.clear()
         self.update()
 
     def move_with_animation(self, target_x: int, target_y: int):
@@ -1,7 +1,8 @@
-from PyQt5.QtWidgets import QWidget, QGraphicsOpacityEffect
-from PyQt5.QtCore import Qt, QRect, QPoint, QPropertyAnimation, QEasingCurve
+from PyQt5.QtWidgets import QWidget
+from PyQt5.QtCore import Qt, QRect, QPoint, QLine, QLineF, QPropertyAnimation, QEasingCurve, QTimer
 from PyQt5.QtGui import QPainter, QColor, QPen, QPainterPath
 from typing import Dict, List, Tuple, Optional, Set
+from contextlib import contextmanager
 from core.ultrawide_grid import JustifyType
 
 class GridOverlay(QWidget):
@@ -21,57 +22,266 @@ class GridOverlay(QWidget):
         self.active_cells = set()
         self.hover_cells = set()
         self.hover_subcell = None
+        self._last_mouse_cell = None
         self.hover_zone = None
         self.active_monitor = None
         self.grid_systems = {}  # Monitor ID -> Grid System
+        self._marker_lines = {}  # Monitor ID -> (all lines, lines per cell)
+        self._grid_lines = {}  # Monitor ID -> {'main': [...], 'sub': [...], 'zones': [...]}
+        self._style_cache = None  # Pens/colors derived from settings, built lazily
+        self._justify_paths = {}  # (JustifyType, monitor rect) -> (lines, arrows)
+
+        # Repaint coalescing state (see batched_updates)
+        self._suspend_updates = False
+        self._pending_update_rect = None
+        self._pending_update_all = False
+
+        # Mouse-move repaints are throttled to ~60Hz; high-rate mice report
+        # far more often than the overlay can usefully repaint
+        self._pending_dirty = None
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(16)
+        self._update_timer.timeout.connect(self._flush_throttled_update)
         
         # Pin and justify state
         self.pinned_windows: Set[int] = set()  # Set of pinned window handles
         self.current_justify = JustifyType.START
         
-        # Setup fade animation
-        self.fade_effect = QGraphicsOpacityEffect(self)
-        self.setGraphicsEffect(self.fade_effect)
-        
-        self.fade_animation = QPropertyAnimation(self.fade_effect, b"opacity")
+        # Setup fade animation on the native window opacity; an opacity
+        # graphics effect would force an offscreen render on every paint
+        self.fade_animation = QPropertyAnimation(self, b"windowOpacity")
         self.fade_animation.setDuration(200)
         self.fade_animation.setEasingCurve(QEasingCurve.OutCubic)
+        # Connected once; hide_overlay must not reconnect per call or the
+        # slot fires once per past hide on every fade
+        self.fade_animation.finished.connect(self._on_fade_finished)
+
+        # Resolve settings-derived pens/colors up front so the first paint
+        # does no hex parsing either
+        self._rebuild_style_cache()
+
+    def update_settings(self, settings: dict):
+        """Update overlay settings and invalidate derived caches."""
+        self.settings = settings or {}
+        self._style_cache = None
+        self._marker_lines.clear()
+        self.update()
+
+    def _rebuild_style_cache(self):
+        """Build pens and colors derived from settings once."""
+        grid_color = QColor(self.settings.get('grid_color', '#FFFFFF'))
+        grid_color.setAlpha(25)  # 10% opacity
+        sub_color = QColor(grid_color)
+        sub_color.setAlpha(15)  # More subtle
+        zone_color = QColor(self.settings.get('zone_color', '#FFA500'))
+        zone_color.setAlpha(40)
+        zone_highlight = QColor(zone_color)
+        zone_highlight.setAlpha(20)
+        marker_color = QColor(self.settings.get('grid_color', '#FFFFFF'))
+        marker_color.setAlpha(76)  # 30% opacity
+        active_color = QColor(self.settings.get('active_cell_color', '#FFA500'))
+        active_color.setAlpha(128)  # 50% opacity
+        hover_color = QColor(self.settings.get('hover_color', '#4CAF50'))
+        hover_color.setAlpha(40)  # 15% opacity
+        hover_outline = QColor(hover_color)
+        hover_outline.setAlpha(100)  # 40% opacity
+        subcell_color = QColor(hover_color)
+        subcell_color.setAlpha(100)  # 40% opacity
+        guide_color = QColor(self.settings.get('guide_color', '#00FF00'))
+        guide_color.setAlpha(100)
+        justify_color = QColor(self.settings.get('justify_color', '#4CAF50'))
+        justify_color.setAlpha(150)
+        pin_color = QColor(self.settings.get('pin_color', '#FF5252'))
+        pin_color.setAlpha(150)
+
+        overlay_alpha = int(255 * self.settings.get('overlay_opacity', 15) / 100)
+
+        self._style_cache = {
+            'overlay_alpha': overlay_alpha,
+            'overlay_color': QColor(0, 0, 0, overlay_alpha),
+            'marker_size': self.settings.get('marker_size', 8),
+            'pen_main': QPen(grid_color, 1),
+            'pen_sub': QPen(sub_color, 1, Qt.DashLine),
+            'pen_zone': QPen(zone_color, 2),
+            'zone_highlight': zone_highlight,
+            'pen_marker': QPen(marker_color, 2),
+            'pen_marker_active': QPen(active_color, 2),
+            'hover_fill': hover_color,
+            'pen_hover_outline': QPen(hover_outline, 2),
+            'subcell_fill': subcell_color,
+            'pen_guide': QPen(guide_color, 1, Qt.DashLine),
+            'pen_justify': QPen(justify_color, 2),
+            'pen_pin': QPen(pin_color, 2),
+        }
 
     def update_grid_systems(self, grid_systems: dict):
         """Update grid systems for all monitors."""
+        if grid_systems == self.grid_systems:
+            return
         self.grid_systems = grid_systems
-        self.update()
+        self._marker_lines.clear()
+        self._grid_lines.clear()
+        self._justify_paths.clear()
+
+        # Precompute reciprocal cell sizes so mouse-move cell lookup
+        # multiplies instead of dividing
+        for grid_system in grid_systems.values():
+            grid_system._inv_cell_w = 1.0 / grid_system.cell_width
+            grid_system._inv_cell_h = 1.0 / grid_system.cell_height
+
+        self._request_update()
     
     def set_active_monitor(self, monitor_id: Optional[str]):
         """Set the currently active monitor."""
         if self.active_monitor != monitor_id:
+            previous = self.active_monitor
             self.active_monitor = monitor_id
             self.hover_zone = None
-            self.update()
-    
+            for changed_id in (previous, monitor_id):
+                if changed_id is not None:
+                    self._update_monitor(changed_id)
+
     def set_hover_zone(self, zone_index: Optional[int]):
         """Set the currently hovered zone."""
         if self.hover_zone != zone_index:
+            old_index = self.hover_zone
             self.hover_zone = zone_index
-            self.update()
-    
+
+            grid_system = self.grid_systems.get(self.active_monitor)
+            if not grid_system:
+                self._request_update()
+                return
+
+            # Invalidate just the zones that changed
+            dirty = None
+            for index in (old_index, zone_index):
+                if index is None:
+                    continue
+                zone_rect = grid_system.get_zone_rect(index)
+                if zone_rect:
+                    dirty = zone_rect if dirty is None else dirty.united(zone_rect)
+
+            self._request_update(dirty if dirty is not None else grid_system.monitor_rect)
+
     def set_active_cells(self, cells: set):
         """Update which grid cells are active."""
+        if cells == self.active_cells:
+            return
+        changed = cells ^ self.active_cells
         self.active_cells = cells
-        self.update()
+
+        grid_system = self.grid_systems.get(self.active_monitor)
+        if not grid_system:
+            self._request_update()
+            return
+
+        # Invalidate only the cells whose state flipped (with a margin for
+        # the corner markers that straddle cell boundaries)
+        dirty = None
+        for col, row in changed:
+            cell_rect = grid_system.get_cell_rect(col, row)
+            dirty = cell_rect if dirty is None else dirty.united(cell_rect)
+
+        if dirty is not None:
+            self._request_update(dirty.adjusted(-8, -8, 8, 8))
+
+    def _get_cached_grid_lines(self, monitor_id: str, grid_system) -> Dict[str, List[QLineF]]:
+        """Get grid lines for a monitor as batched QLineF lists."""
+        cached = self._grid_lines.get(monitor_id)
+        if cached is None:
+            raw_lines = grid_system.get_grid_lines()
+            cached = {
+                key: [QLineF(start, end) for start, end in segments]
+                for key, segments in raw_lines.items()
+            }
+            self._grid_lines[monitor_id] = cached
+        return cached
+
+    def _update_monitor(self, monitor_id: Optional[str]):
+        """Request a repaint limited to one monitor's area."""
+        grid_system = self.grid_systems.get(monitor_id)
+        if grid_system:
+            self._request_update(grid_system.monitor_rect)
+        else:
+            self._request_update()
+
+    def _request_update(self, rect: Optional[QRect] = None):
+        """Issue or, inside batched_updates, accumulate a repaint request."""
+        if self._suspend_updates:
+            if rect is None:
+                self._pending_update_all = True
+            elif self._pending_update_rect is None:
+                self._pending_update_rect = QRect(rect)
+            else:
+                self._pending_update_rect = self._pending_update_rect.united(rect)
+            return
+
+        if rect is None:
+            self.update()
+        else:
+            self.update(rect)
+
+    def _throttled_update(self, rect: QRect):
+        """Accumulate a dirty rect and repaint on the next ~16ms tick."""
+        if self._pending_dirty is None:
+            self._pending_dirty = QRect(rect)
+        else:
+            self._pending_dirty = self._pending_dirty.united(rect)
+        if not self._update_timer.isActive():
+            self._update_timer.start()
+
+    def _flush_throttled_update(self):
+        """Issue the repaint accumulated by _throttled_update."""
+        if self._pending_dirty is not None:
+            dirty = self._pending_dirty
+            self._pending_dirty = None
+            self._request_update(dirty)
+
+    @contextmanager
+    def batched_updates(self):
+        """Coalesce repaints from a series of setter calls into one update."""
+        if self._suspend_updates:
+            yield
+            return
+
+        self._suspend_updates = True
+        try:
+            yield
+        finally:
+            self._suspend_updates = False
+            if self._pending_update_all:
+                self.update()
+            elif self._pending_update_rect is not None:
+                self.update(self._pending_update_rect)
+            self._pending_update_all = False
+            self._pending_update_rect = None
     
     def set_justification(self, justify_type: JustifyType):
         """Set current justification type."""
+        if justify_type == self.current_justify:
+            return
         self.current_justify = justify_type
-        self.update()
-    
+        self._request_update()
+
     def toggle_window_pin(self, window_handle: int):
         """Toggle pin state for a window."""
         if window_handle in self.pinned_windows:
             self.pinned_windows.remove(window_handle)
         else:
             self.pinned_windows.add(window_handle)
-        self.update()
+
+        # Repaint only the pin indicator area when the window is known
+        pin_size = 12
+        for grid_system in self.grid_systems.values():
+            rect = grid_system.pinned_windows.get(window_handle)
+            if rect is not None:
+                self._request_update(QRect(
+                    rect.topRight() - QPoint(pin_size, pin_size),
+                    rect.topRight() + QPoint(pin_size, pin_size)
+                ))
+                return
+        self._request_update()
     
     def show_overlay(self):
         """Show overlay with fade animation."""
@@ -81,14 +291,18 @@ class GridOverlay(QWidget):
         self.show()
         self.raise_()
         self.fade_animation.start()
-    
+
     def hide_overlay(self):
         """Hide overlay with fade animation."""
         self.fade_animation.stop()
         self.fade_animation.setStartValue(1)
         self.fade_animation.setEndValue(0)
-        self.fade_animation.finished.connect(self.hide)
         self.fade_animation.start()
+
+    def _on_fade_finished(self):
+        """Hide the window once a fade-out completes."""
+        if self.fade_animation.endValue() == 0:
+            self.hide()
     
     def mouseMoveEvent(self, event):
         """Handle mouse movement to highlight cells."""
@@ -102,97 +316,122 @@ class GridOverlay(QWidget):
         
         # Convert mouse position to grid cell
         mouse_pos = event.pos()
-        cell_width = grid_system.cell_width
-        cell_height = grid_system.cell_height
-        
+        local_x = mouse_pos.x() - grid_system.monitor_rect.x()
+        local_y = mouse_pos.y() - grid_system.monitor_rect.y()
+        inv_w = getattr(grid_system, '_inv_cell_w', 1.0 / grid_system.cell_width)
+        inv_h = getattr(grid_system, '_inv_cell_h', 1.0 / grid_system.cell_height)
+
         # Calculate cell coordinates
-        col = int((mouse_pos.x() - grid_system.monitor_rect.x()) / cell_width)
-        row = int((mouse_pos.y() - grid_system.monitor_rect.y()) / cell_height)
-        
+        col = int(local_x * inv_w)
+        row = int(local_y * inv_h)
+
+        # With subdivisions the hovered quadrant is part of the hover
+        # state, so it has to be in the early-out key too
+        if grid_system.subdivisions:
+            subcol = int((local_x - col * grid_system.cell_width) * inv_w * 2)
+            subrow = int((local_y - row * grid_system.cell_height) * inv_h * 2)
+            mouse_cell = (col, row, subcol, subrow)
+        else:
+            mouse_cell = (col, row)
+
+        # Early-out while the mouse stays inside the same (sub)cell
+        if mouse_cell == self._last_mouse_cell:
+            return
+
         # Ensure within grid bounds
         if 0 <= col < grid_system.columns and 0 <= row < grid_system.rows:
+            self._last_mouse_cell = mouse_cell
+
             # Update hover cell
             old_hover_cells = self.hover_cells
+            old_subcell = self.hover_subcell
             self.hover_cells = {(col, row)}
-            
+
             # If using subdivisions, also highlight subcell
             if grid_system.subdivisions:
-                subcol = int((mouse_pos.x() - grid_system.monitor_rect.x() - col * cell_width) / 
-                            (cell_width / 2))
-                subrow = int((mouse_pos.y() - grid_system.monitor_rect.y() - row * cell_height) / 
-                            (cell_height / 2))
                 self.hover_subcell = (subcol, subrow)
-            
+
             # Check if hover changed
-            if old_hover_cells != self.hover_cells:
-                self.update()
-                
+            if (old_hover_cells != self.hover_cells
+                    or old_subcell != self.hover_subcell):
+                # Repaint just the old and new hover cells
+                dirty = grid_system.get_cell_rect(col, row)
+                for old_col, old_row in old_hover_cells:
+                    dirty = dirty.united(grid_system.get_cell_rect(old_col, old_row))
+                self._throttled_update(dirty.adjusted(-2, -2, 2, 2))
+
                 # Show tooltip with cell coordinates
                 self.setToolTip(f"Cell: {col+1}x{row+1}")
         else:
+            self._last_mouse_cell = None
+
             # Clear hover if outside grid
             if self.hover_cells:
+                dirty = None
+                for old_col, old_row in self.hover_cells:
+                    cell_rect = grid_system.get_cell_rect(old_col, old_row)
+                    dirty = cell_rect if dirty is None else dirty.united(cell_rect)
                 self.hover_cells = set()
                 self.hover_subcell = None
-                self.update()
+                if dirty is not None:
+                    self._throttled_update(dirty.adjusted(-2, -2, 2, 2))
                 self.setToolTip("")
     
     def paintEvent(self, event):
         """Draw the grid overlay."""
+        # Nothing is visible at zero opacity — but only skip when a
+        # fade-out is what got us here. A fade-in also starts at 0, and
+        # since setWindowOpacity never invalidates the widget, dropping
+        # that expose paint would leave the surface blank for the whole
+        # fade
+        if self.windowOpacity() == 0 and self.fade_animation.endValue() == 0:
+            return
+
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
-        
+        region = event.region()
+
+        if self._style_cache is None:
+            self._rebuild_style_cache()
+        style = self._style_cache
+
         # Draw for each monitor's grid system
         for monitor_id, grid_system in self.grid_systems.items():
+            # Skip monitors outside the dirty region
+            if not region.intersects(grid_system.monitor_rect):
+                continue
+
             is_active = monitor_id == self.active_monitor
             is_ultrawide = grid_system.is_ultrawide
             
             # Draw background overlay
-            overlay_opacity = self.settings.get('overlay_opacity', 15)
-            painter.fillRect(
-                grid_system.monitor_rect,
-                QColor(0, 0, 0, int(255 * overlay_opacity / 100))
-            )
-            
-            # Get all grid lines
-            lines = grid_system.get_grid_lines()
-            
+            painter.fillRect(grid_system.monitor_rect, style['overlay_color'])
+
+            # Get all grid lines (cached as QLineF batches)
+            lines = self._get_cached_grid_lines(monitor_id, grid_system)
+
             # Draw main grid lines
-            grid_color = QColor(self.settings.get('grid_color', '#FFFFFF'))
-            grid_color.setAlpha(25)  # 10% opacity
-            painter.setPen(QPen(grid_color, 1))
-            
-            for start, end in lines['main']:
-                painter.drawLine(start, end)
-            
+            painter.setPen(style['pen_main'])
+            painter.drawLines(lines['main'])
+
             # Draw subdivision lines if enabled
             if grid_system.subdivisions:
-                sub_color = QColor(grid_color)
-                sub_color.setAlpha(15)  # More subtle
-                painter.setPen(QPen(sub_color, 1, Qt.DashLine))
-                
-                for start, end in lines['sub']:
-                    painter.drawLine(start, end)
-            
+                painter.setPen(style['pen_sub'])
+                painter.drawLines(lines['sub'])
+
             # Draw zone separators for ultrawide
             if is_ultrawide:
-                zone_color = QColor(self.settings.get('zone_color', '#FFA500'))
-                zone_color.setAlpha(40)
-                painter.setPen(QPen(zone_color, 2))
-                
-                for start, end in lines['zones']:
-                    painter.drawLine(start, end)
-                
+                painter.setPen(style['pen_zone'])
+                painter.drawLines(lines['zones'])
+
                 # Draw zone highlight if hovering
                 if is_active and self.hover_zone is not None:
                     zone_rect = grid_system.get_zone_rect(self.hover_zone)
                     if zone_rect:
-                        highlight = QColor(zone_color)
-                        highlight.setAlpha(20)
-                        painter.fillRect(zone_rect, highlight)
+                        painter.fillRect(zone_rect, style['zone_highlight'])
             
             # Draw cell markers and pinned indicators
-            self._draw_cell_markers(painter, grid_system, is_active)
+            self._draw_cell_markers(painter, monitor_id, grid_system, is_active)
             
             # Draw hover feedback if active
             if is_active:
@@ -209,167 +448,197 @@ class GridOverlay(QWidget):
             # Draw pin indicators
             self._draw_pin_indicators(painter, grid_system)
     
-    def _draw_cell_markers(self, painter: QPainter, grid_system, is_active: bool):
-        """Draw grid cell markers."""
-        marker_size = self.settings.get('marker_size', 8)
-        active_color = QColor(self.settings.get('active_cell_color', '#FFA500'))
-        active_color.setAlpha(128)  # 50% opacity
-        
-        for col in range(grid_system.columns + 1):
-            for row in range(grid_system.rows + 1):
-                x = grid_system.monitor_rect.x() + (col * grid_system.cell_width)
-                y = grid_system.monitor_rect.y() + (row * grid_system.cell_height)
-                
-                if (col, row) in self.active_cells and is_active:
-                    painter.setPen(QPen(active_color, 2))
-                else:
-                    marker_color = QColor(self.settings.get('grid_color', '#FFFFFF'))
-                    marker_color.setAlpha(76)  # 30% opacity
-                    painter.setPen(QPen(marker_color, 2))
-                
-                # Draw "+" marker
-                painter.drawLine(
-                    int(x - marker_size/2), int(y),
-                    int(x + marker_size/2), int(y)
-                )
-                painter.drawLine(
-                    int(x), int(y - marker_size/2),
-                    int(x), int(y + marker_size/2)
+    def _build_marker_lines(self, grid_system) -> Tuple[QPainterPath, Dict[Tuple[int, int], Tuple[QLine, QLine]]]:
+        """Precompute the "+" marker geometry for a grid system."""
+        if self._style_cache is None:
+            self._rebuild_style_cache()
+        half = self._style_cache['marker_size'] // 2
+        marker_path = QPainterPath()
+        cell_lines = {}
+
+        # Quantize each axis to ints once so the per-cell math and the
+        # QLine construction stay in integer arithmetic throughout
+        origin_x = grid_system.monitor_rect.x()
+        origin_y = grid_system.monitor_rect.y()
+        cell_width = grid_system.cell_width
+        cell_height = grid_system.cell_height
+        xs = [int(origin_x + (col * cell_width)) for col in range(grid_system.columns + 1)]
+        ys = [int(origin_y + (row * cell_height)) for row in range(grid_system.rows + 1)]
+
+        # Bind bound methods once; the loop body otherwise pays an
+        # attribute lookup per drawn segment
+        move_to = marker_path.moveTo
+        line_to = marker_path.lineTo
+
+        for col, x in enumerate(xs):
+            for row, y in enumerate(ys):
+                cell_lines[(col, row)] = (
+                    QLine(x - half, y, x + half, y),
+                    QLine(x, y - half, x, y + half)
                 )
+                move_to(x - half, y)
+                line_to(x + half, y)
+                move_to(x, y - half)
+                line_to(x, y + half)
+
+        return marker_path, cell_lines
+
+    def _draw_cell_markers(self, painter: QPainter, monitor_id: str, grid_system, is_active: bool):
+        """Draw grid cell markers."""
+        cached = self._marker_lines.get(monitor_id)
+        if cached is None:
+            cached = self._build_marker_lines(grid_system)
+            self._marker_lines[monitor_id] = cached
+        marker_path, cell_lines = cached
+
+        # Stroke the entire crosshair grid as one cached path
+        painter.setPen(self._style_cache['pen_marker'])
+        painter.drawPath(marker_path)
+
+        # Overdraw active cell markers with the highlight pen
+        if is_active and self.active_cells:
+            active_lines = []
+            for cell in self.active_cells:
+                pair = cell_lines.get(cell)
+                if pair:
+                    active_lines.extend(pair)
+
+            if active_lines:
+                painter.setPen(self._style_cache['pen_marker_active'])
+                painter.drawLines(active_lines)
     
     def _draw_hover_feedback(self, painter, grid_system):
         """Draw hover feedback for grid cells."""
         if not self.hover_cells:
             return
-            
-        # Use a semi-transparent highlight color
-        hover_color = QColor(self.settings.get('hover_color', '#4CAF50'))
-        hover_color.setAlpha(40)  # 15% opacity
-        
+
+        style = self._style_cache
+
         # Draw cell highlight
         for col, row in self.hover_cells:
             cell_rect = grid_system.get_cell_rect(col, row)
-            painter.fillRect(cell_rect, hover_color)
-            
+            painter.fillRect(cell_rect, style['hover_fill'])
+
             # Draw outline with slightly higher opacity
-            outline_color = QColor(hover_color)
-            outline_color.setAlpha(100)  # 40% opacity
-            painter.setPen(QPen(outline_color, 2))
+            painter.setPen(style['pen_hover_outline'])
             painter.drawRect(cell_rect)
-            
+
             # If subdivision is active, highlight subcell
             if grid_system.subdivisions and self.hover_subcell:
                 subcol, subrow = self.hover_subcell
                 subcell_rect = grid_system.get_subcell_rect(col, row, subcol, subrow)
-                
+
                 # Draw subcell with higher opacity
-                subcell_color = QColor(hover_color)
-                subcell_color.setAlpha(100)  # 40% opacity
-                painter.fillRect(subcell_rect, subcell_color)
-                
+                painter.fillRect(subcell_rect, style['subcell_fill'])
+
                 # Draw subcell outline
-                painter.setPen(QPen(outline_color, 2))
+                painter.setPen(style['pen_hover_outline'])
                 painter.drawRect(subcell_rect)
     
     def _draw_snap_guidelines(self, painter: QPainter, grid_system):
         """Draw guidelines for snap assistance."""
         if not grid_system.snap_guides:
             return
-            
-        guide_color = QColor(self.settings.get('guide_color', '#00FF00'))
-        guide_color.setAlpha(100)
-        painter.setPen(QPen(guide_color, 1, Qt.DashLine))
+
+        painter.setPen(self._style_cache['pen_guide'])
         
         for guide in grid_system.snap_guides:
             painter.drawLine(guide[0], guide[1])
     
     def _draw_justify_indicators(self, painter: QPainter, grid_system):
         """Draw indicators showing current justification type."""
-        indicator_color = QColor(self.settings.get('justify_color', '#4CAF50'))
-        indicator_color.setAlpha(150)
-        painter.setPen(QPen(indicator_color, 2))
-        
         rect = grid_system.monitor_rect
-        arrow_size = 20
-        
-        if self.current_justify == JustifyType.START:
-            self._draw_justify_arrow(painter, rect.topLeft(), arrow_size, 0)
-        elif self.current_justify == JustifyType.END:
-            self._draw_justify_arrow(painter, rect.topRight(), arrow_size, 180)
-        elif self.current_justify == JustifyType.CENTER:
-            self._draw_center_indicator(painter, rect, arrow_size)
-        elif self.current_justify == JustifyType.SPACE_BETWEEN:
-            self._draw_space_between_indicator(painter, rect, arrow_size)
-        elif self.current_justify == JustifyType.SPACE_AROUND:
-            self._draw_space_around_indicator(painter, rect, arrow_size)
-        elif self.current_justify == JustifyType.SPACE_EVENLY:
-            self._draw_space_evenly_indicator(painter, rect, arrow_size)
+        key = (self.current_justify, rect.getRect())
+        cached = self._justify_paths.get(key)
+        if cached is None:
+            cached = self._build_justify_paths(self.current_justify, rect)
+            self._justify_paths[key] = cached
+        line_path, arrow_path = cached
+
+        pen = self._style_cache['pen_justify']
+        painter.setPen(pen)
+        painter.drawPath(line_path)
+        painter.fillPath(arrow_path, pen.color())
     
     def _draw_pin_indicators(self, painter: QPainter, grid_system):
         """Draw indicators for pinned windows."""
         if not self.pinned_windows:
             return
-            
-        pin_color = QColor(self.settings.get('pin_color', '#FF5252'))
-        pin_color.setAlpha(150)
-        painter.setPen(QPen(pin_color, 2))
-        
+
+        painter.setPen(self._style_cache['pen_pin'])
+
+        # Intersect once instead of probing the dict per handle
+        visible = self.pinned_windows & grid_system.pinned_windows.keys()
+
         pin_size = 12
-        for window_handle in self.pinned_windows:
-            if window_handle in grid_system.pinned_windows:
-                rect = grid_system.pinned_windows[window_handle]
-                self._draw_pin_icon(painter, rect.topRight(), pin_size)
+        for window_handle in visible:
+            rect = grid_system.pinned_windows[window_handle]
+            self._draw_pin_icon(painter, rect.topRight(), pin_size)
     
-    def _draw_justify_arrow(self, painter: QPainter, point: QPoint, size: int, angle: int):
-        """Draw an arrow indicating justification direction."""
-        path = QPainterPath()
+    def _build_justify_paths(self, justify_type: JustifyType, rect: QRect) -> Tuple[QPainterPath, QPainterPath]:
+        """Build the line and arrow paths for a justification indicator.
+
+        The geometry only depends on the justify type and monitor rect, so
+        the result is cached and repaints reduce to two draw calls.
+        """
+        line_path = QPainterPath()
+        arrow_path = QPainterPath()
+        size = 20
+
+        if justify_type == JustifyType.START:
+            self._append_justify_arrow(arrow_path, rect.topLeft(), size)
+        elif justify_type == JustifyType.END:
+            self._append_justify_arrow(arrow_path, rect.topRight(), size)
+        elif justify_type == JustifyType.CENTER:
+            center = rect.center()
+            line_path.moveTo(center - QPoint(size, 0))
+            line_path.lineTo(center + QPoint(size, 0))
+            self._append_justify_arrow(arrow_path, center - QPoint(size, 0), size//2)
+            self._append_justify_arrow(arrow_path, center + QPoint(size, 0), size//2)
+        elif justify_type == JustifyType.SPACE_BETWEEN:
+            y = rect.top() + size
+            x_start = rect.left() + size * 2
+            x_end = rect.right() - size * 2
+
+            # Arrows pointing outward
+            line_path.moveTo(x_start, y)
+            line_path.lineTo(x_end, y)
+            self._append_justify_arrow(arrow_path, QPoint(x_start, y), size//2)
+            self._append_justify_arrow(arrow_path, QPoint(x_end, y), size//2)
+        elif justify_type == JustifyType.SPACE_AROUND:
+            y = rect.top() + size
+            x_start = rect.left() + size * 3
+            x_end = rect.right() - size * 3
+
+            # Arrows pointing outward with spaces
+            line_path.moveTo(x_start, y)
+            line_path.lineTo(x_start + size, y)
+            line_path.moveTo(x_end - size, y)
+            line_path.lineTo(x_end, y)
+            self._append_justify_arrow(arrow_path, QPoint(x_start, y), size//2)
+            self._append_justify_arrow(arrow_path, QPoint(x_end, y), size//2)
+        elif justify_type == JustifyType.SPACE_EVENLY:
+            y = rect.top() + size
+            x_start = rect.left() + size * 2
+            x_middle = rect.center().x()
+            x_end = rect.right() - size * 2
+
+            # Evenly spaced ticks along the line
+            line_path.moveTo(x_start, y)
+            line_path.lineTo(x_end, y)
+            for x in (x_start, x_middle, x_end):
+                line_path.moveTo(x, y - size//2)
+                line_path.lineTo(x, y + size//2)
+
+        return line_path, arrow_path
+
+    @staticmethod
+    def _append_justify_arrow(path: QPainterPath, point: QPoint, size: int):
+        """Append an arrow indicating justification direction to a path."""
         path.moveTo(point)
         path.lineTo(point + QPoint(size, size//2))
         path.lineTo(point + QPoint(size, -size//2))
         path.lineTo(point)
-        painter.fillPath(path, painter.pen().color())
-    
-    def _draw_center_indicator(self, painter: QPainter, rect: QRect, size: int):
-        """Draw center justification indicator."""
-        center = rect.center()
-        painter.drawLine(center - QPoint(size, 0), center + QPoint(size, 0))
-        self._draw_justify_arrow(painter, center - QPoint(size, 0), size//2, 0)
-        self._draw_justify_arrow(painter, center + QPoint(size, 0), size//2, 180)
-    
-    def _draw_space_between_indicator(self, painter: QPainter, rect: QRect, size: int):
-        """Draw space-between justification indicator."""
-        y = rect.top() + size
-        x_start = rect.left() + size * 2
-        x_end = rect.right() - size * 2
-        
-        # Draw arrows pointing outward
-        painter.drawLine(x_start, y, x_end, y)
-        self._draw_justify_arrow(painter, QPoint(x_start, y), size//2, 180)
-        self._draw_justify_arrow(painter, QPoint(x_end, y), size//2, 0)
-    
-    def _draw_space_around_indicator(self, painter: QPainter, rect: QRect, size: int):
-        """Draw space-around justification indicator."""
-        y = rect.top() + size
-        x_start = rect.left() + size * 3
-        x_end = rect.right() - size * 3
-        
-        # Draw arrows pointing outward with spaces
-        painter.drawLine(x_start, y, x_start + size, y)
-        painter.drawLine(x_end - size, y, x_end, y)
-        self._draw_justify_arrow(painter, QPoint(x_start, y), size//2, 180)
-        self._draw_justify_arrow(painter, QPoint(x_end, y), size//2, 0)
-    
-    def _draw_space_evenly_indicator(self, painter: QPainter, rect: QRect, size: int):
-        """Draw space-evenly justification indicator."""
-        y = rect.top() + size
-        x_start = rect.left() + size * 2
-        x_middle = rect.center().x()
-        x_end = rect.right() - size * 2
-        
-        # Draw evenly spaced indicators
-        painter.drawLine(x_start, y, x_end, y)
-        for x in [x_start, x_middle, x_end]:
-            painter.drawLine(x, y - size//2, x, y + size//2)
     
     def _draw_pin_icon(self, painter: QPainter, point: QPoint, size: int):
         """Draw a pin icon."""
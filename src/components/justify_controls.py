@@ -1,14 +1,16 @@
 from PyQt5.QtWidgets import QWidget, QGraphicsOpacityEffect
-from PyQt5.QtCore import Qt, QPoint, QPropertyAnimation, QEasingCurve, pyqtSignal, QSize
-from PyQt5.QtGui import QPainter, QPainterPath, QColor, QPen
-from typing import Dict
+from PyQt5.QtCore import Qt, QRect, QRectF, QPoint, QPropertyAnimation, QEasingCurve, pyqtSignal, QSize
+from PyQt5.QtGui import QPainter, QPainterPath, QColor, QPen, QPixmap
+from typing import Dict, Optional
 from core.ultrawide_grid import JustifyType
 
 class JustifyControls(QWidget):
     """Floating controls for window justification."""
     
     justify_changed = pyqtSignal(JustifyType)  # Emitted when justification changes
-    
+
+    _ICON_MARGIN = 8  # Padding between button edge and icon bounds
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowFlags(Qt.FramelessWindowHint | Qt.Tool | Qt.WindowStaysOnTopHint)
@@ -33,6 +35,9 @@ class JustifyControls(QWidget):
         self.fade_animation = QPropertyAnimation(self.fade_effect, b"opacity")
         self.fade_animation.setDuration(150)
         self.fade_animation.setEasingCurve(QEasingCurve.OutCubic)
+        # Connected once; hide_controls must not reconnect per call or the
+        # slot fires once per past hide on every fade
+        self.fade_animation.finished.connect(self._on_fade_finished)
         
         # Define button layouts
         self.buttons = {
@@ -43,13 +48,55 @@ class JustifyControls(QWidget):
             JustifyType.SPACE_AROUND: (self.button_size + self.spacing, self.button_size + self.spacing),
             JustifyType.SPACE_EVENLY: ((self.button_size + self.spacing) * 2, self.button_size + self.spacing)
         }
-        
+
+        # Precompute button rects and rounded backgrounds; the layout is
+        # fixed, so paint and hit-testing reuse these instead of building
+        # QRect/QPainterPath objects per event
+        self._button_rects = [
+            (justify_type, QRect(x, y, self.button_size, self.button_size))
+            for justify_type, (x, y) in self.buttons.items()
+        ]
+        self._button_paths = {}
+        self._icon_rects = {}
+        for justify_type, rect in self._button_rects:
+            path = QPainterPath()
+            path.addRoundedRect(QRectF(rect), 8, 8)
+            self._button_paths[justify_type] = path
+            margin = self._ICON_MARGIN
+            self._icon_rects[justify_type] = rect.adjusted(margin, margin, -margin, -margin)
+
+        # Row-major lookup matching the fixed 3x2 button layout, for O(1)
+        # hit-testing in the mouse handlers
+        self._button_lookup = (
+            (JustifyType.START, JustifyType.CENTER, JustifyType.END),
+            (JustifyType.SPACE_BETWEEN, JustifyType.SPACE_AROUND, JustifyType.SPACE_EVENLY)
+        )
+
+
         # Colors
         self.base_color = QColor(65, 65, 65)
         self.hover_color = QColor(75, 75, 75)
         self.active_color = QColor("#4CAF50")
         self.icon_color = QColor(255, 255, 255)
-    
+
+        # All six buttons in their base state, pre-rendered once; paints
+        # blit this and only redraw the hovered/active buttons on top
+        self._base_pixmap = None
+
+    def _rebuild_base_pixmap(self):
+        """Pre-render every button in its base state into one pixmap."""
+        pixmap = QPixmap(self.size())
+        pixmap.fill(Qt.transparent)
+
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        for justify_type, _ in self._button_rects:
+            painter.fillPath(self._button_paths[justify_type], self.base_color)
+            self._draw_justify_icon(painter, justify_type)
+        painter.end()
+
+        self._base_pixmap = pixmap
+
     def show_controls(self):
         """Show controls with fade animation."""
         self.fade_animation.setStartValue(0)
@@ -62,40 +109,52 @@ class JustifyControls(QWidget):
         """Hide controls with fade animation."""
         self.fade_animation.setStartValue(1)
         self.fade_animation.setEndValue(0)
-        self.fade_animation.finished.connect(self.hide)
         self.fade_animation.start()
+
+    def _on_fade_finished(self):
+        """Hide the widget once a fade-out completes."""
+        if self.fade_animation.endValue() == 0:
+            self.hide()
     
     def paintEvent(self, event):
         """Draw the justification controls."""
+        # Nothing is visible at zero opacity; skip the whole pass rather
+        # than rasterize a frame the effect will blend away
+        if self.fade_effect.opacity() == 0:
+            return
+
+        if self._base_pixmap is None:
+            self._rebuild_base_pixmap()
+
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
-        
-        for justify_type, pos in self.buttons.items():
-            rect = QRect(pos[0], pos[1], self.button_size, self.button_size)
-            
-            # Draw button background
-            path = QPainterPath()
-            path.addRoundedRect(rect, 8, 8)
-            
+        region = event.region()
+
+        # Blit the pre-rendered base state, then overdraw only the buttons
+        # that differ from it
+        painter.drawPixmap(0, 0, self._base_pixmap)
+
+        for justify_type, rect in self._button_rects:
             if justify_type == self.current_justify:
-                painter.fillPath(path, self.active_color)
+                fill = self.active_color
             elif justify_type == self.hover_button:
-                painter.fillPath(path, self.hover_color)
+                fill = self.hover_color
             else:
-                painter.fillPath(path, self.base_color)
-            
-            # Draw justify icon
-            self._draw_justify_icon(painter, justify_type, rect)
-    
-    def _draw_justify_icon(self, painter: QPainter, justify_type: JustifyType, rect: QRect):
+                continue
+
+            # Skip buttons outside the dirty region
+            if not region.intersects(rect):
+                continue
+
+            painter.fillPath(self._button_paths[justify_type], fill)
+            self._draw_justify_icon(painter, justify_type)
+
+    def _draw_justify_icon(self, painter: QPainter, justify_type: JustifyType):
         """Draw the icon for each justification type."""
         painter.setPen(QPen(self.icon_color, 2))
-        
-        # Calculate icon bounds
-        icon_margin = 8
-        icon_rect = rect.adjusted(icon_margin, icon_margin, -icon_margin, -icon_margin)
-        center_y = icon_rect.center().y()
-        
+
+        icon_rect = self._icon_rects[justify_type]
+
         if justify_type == JustifyType.START:
             self._draw_start_icon(painter, icon_rect)
         elif justify_type == JustifyType.CENTER:
@@ -168,27 +227,31 @@ class JustifyControls(QWidget):
         path.closeSubpath()
         painter.fillPath(path, self.icon_color)
     
+    def _button_at(self, pos) -> Optional[JustifyType]:
+        """Map a cursor position to a button via direct grid arithmetic."""
+        step = self.button_size + self.spacing
+        col, x_offset = divmod(pos.x(), step)
+        row, y_offset = divmod(pos.y(), step)
+
+        # Reject positions in the spacing gaps or outside the 3x2 layout
+        if (0 <= row < len(self._button_lookup) and 0 <= col < 3
+                and x_offset < self.button_size and y_offset < self.button_size):
+            return self._button_lookup[row][col]
+        return None
+
     def mousePressEvent(self, event):
         """Handle mouse press to select justification."""
-        for justify_type, pos in self.buttons.items():
-            rect = QRect(pos[0], pos[1], self.button_size, self.button_size)
-            if rect.contains(event.pos()):
-                self.current_justify = justify_type
-                self.justify_changed.emit(justify_type)
-                self.update()
-                break
-    
+        justify_type = self._button_at(event.pos())
+        if justify_type is not None:
+            self.current_justify = justify_type
+            self.justify_changed.emit(justify_type)
+            self.update()
+
     def mouseMoveEvent(self, event):
         """Handle mouse movement for hover effects."""
         old_hover = self.hover_button
-        self.hover_button = None
-        
-        for justify_type, pos in self.buttons.items():
-            rect = QRect(pos[0], pos[1], self.button_size, self.button_size)
-            if rect.contains(event.pos()):
-                self.hover_button = justify_type
-                break
-        
+        self.hover_button = self._button_at(event.pos())
+
         if old_hover != self.hover_button:
             self.update()
     
@@ -1,5 +1,5 @@
 from PyQt5.QtWidgets import QWidget, QGraphicsOpacityEffect
-from PyQt5.QtCore import Qt, QPropertyAnimation, QEasingCurve, pyqtSignal, QPoint
+from PyQt5.QtCore import Qt, QLine, QPropertyAnimation, QEasingCurve, pyqtSignal, QPoint
 from PyQt5.QtGui import QPainter, QPainterPath, QColor, QPen, QFont
 
 class LayoutStatusIndicator(QWidget):
@@ -21,7 +21,14 @@ class LayoutStatusIndicator(QWidget):
         self.temp_color = QColor("#FFA500")  # Orange for temporary
         self.saved_color = QColor("#4CAF50")  # Green for saved
         self.modified_color = QColor("#FF5252")  # Red for unsaved changes
-        
+
+        # Static paint geometry, built once
+        self._bg_path = QPainterPath()
+        self._bg_path.addEllipse(2, 2, 20, 20)
+        self._check_lines = [QLine(7, 12, 10, 15), QLine(10, 15, 17, 8)]
+        self._icon_pen = QPen(Qt.white, 2)
+        self._temp_font = QFont("Arial", 12, QFont.Bold)
+
         # Setup animations
         self.setup_animations()
     
@@ -47,15 +54,32 @@ class LayoutStatusIndicator(QWidget):
         """Set unsaved changes status."""
         if self.has_changes != has_changes:
             self.has_changes = has_changes
-            
-            # Start/stop pulse animation
+
+            # Start/stop pulse animation; while hidden the start is
+            # deferred to showEvent so we never animate off-screen
             if has_changes and not self.pulse_animation.state():
-                self.pulse_animation.start()
+                if self.isVisible():
+                    self.pulse_animation.start()
             elif not has_changes and self.pulse_animation.state():
                 self.pulse_animation.stop()
                 self.opacity_effect.setOpacity(1.0)
-            
+
             self.update()
+
+    def showEvent(self, event):
+        """Resume the pulse animation when the indicator becomes visible."""
+        super().showEvent(event)
+        if self.has_changes:
+            if self.pulse_animation.state() == QPropertyAnimation.Paused:
+                self.pulse_animation.resume()
+            elif not self.pulse_animation.state():
+                self.pulse_animation.start()
+
+    def hideEvent(self, event):
+        """Pause the pulse animation while the indicator is hidden."""
+        super().hideEvent(event)
+        if self.pulse_animation.state() == QPropertyAnimation.Running:
+            self.pulse_animation.pause()
     
     def paintEvent(self, event):
         """Draw the status indicator."""
@@ -71,24 +95,20 @@ class LayoutStatusIndicator(QWidget):
             color = self.saved_color
         
         # Draw circle background
-        path = QPainterPath()
-        path.addEllipse(2, 2, 20, 20)
-        
-        painter.fillPath(path, color)
-        
+        painter.fillPath(self._bg_path, color)
+
         # Draw icon based on state
-        painter.setPen(QPen(Qt.white, 2))
+        painter.setPen(self._icon_pen)
         if self.has_changes:
             # Draw dot
             painter.drawEllipse(10, 10, 4, 4)
         elif self.is_temporary:
             # Draw T
-            painter.setFont(QFont("Arial", 12, QFont.Bold))
-            painter.drawText(rect(), Qt.AlignCenter, "T")
+            painter.setFont(self._temp_font)
+            painter.drawText(self.rect(), Qt.AlignCenter, "T")
         else:
             # Draw checkmark
-            painter.drawLine(7, 12, 10, 15)
-            painter.drawLine(10, 15, 17, 8)
+            painter.drawLines(self._check_lines)
     
     def mousePressEvent(self, event):
         """Handle mouse press."""
@@ -1,6 +1,7 @@
 from PyQt5.QtWidgets import QWidget, QGraphicsOpacityEffect
-from PyQt5.QtCore import Qt, QRect, QPropertyAnimation, QEasingCurve
-from PyQt5.QtGui import QPainter, QColor, QPen, QPainterPath
+from PyQt5.QtCore import (Qt, QLine, QRect, QRectF, QPropertyAnimation,
+                          QParallelAnimationGroup, QEasingCurve, QTimer)
+from PyQt5.QtGui import QGuiApplication, QPainter, QColor, QPen, QPainterPath, QRegion
 
 class PreviewRect(QWidget):
     """Animated preview rectangle for window placement."""
@@ -16,7 +17,17 @@ class PreviewRect(QWidget):
         self.opacity = 0.3
         self.border_width = 2
         self.corner_radius = 8
-        
+
+        # Paint geometry/colors derived from size, color and opacity; the
+        # geometry animation repaints every tick, so these are cached and
+        # rebuilt only when the key below changes
+        self._cache_key = None
+        self._border_path = None
+        self._border_pen = None
+        self._corner_pen = None
+        self._fill_color = None
+        self._corner_lines = ()
+
         # Setup fade animation
         self.fade_effect = QGraphicsOpacityEffect(self)
         self.setGraphicsEffect(self.fade_effect)
@@ -24,39 +35,110 @@ class PreviewRect(QWidget):
         self.fade_animation = QPropertyAnimation(self.fade_effect, b"opacity")
         self.fade_animation.setDuration(200)
         self.fade_animation.setEasingCurve(QEasingCurve.OutCubic)
-        
+        # Connected once; hide_preview must not reconnect per call or the
+        # slot fires once per past hide on every fade
+        self.fade_animation.finished.connect(self._on_fade_finished)
+
         # Setup position/size animation
         self.geometry_animation = QPropertyAnimation(self, b"geometry")
         self.geometry_animation.setDuration(150)
         self.geometry_animation.setEasingCurve(QEasingCurve.OutCubic)
-    
+
+        # Both animations run under one group so a combined show-and-place
+        # shares a single animation driver instead of two parallel tickers.
+        # Whichever property is not being animated is held at its current
+        # value for the run (see _hold_fade/_hold_geometry)
+        self._anim_group = QParallelAnimationGroup(self)
+        self._anim_group.addAnimation(self.fade_animation)
+        self._anim_group.addAnimation(self.geometry_animation)
+
+        # Repaint requests are coalesced to one per display refresh; bursts
+        # of set_rect/set_color calls during drags otherwise each repaint
+        screen = QGuiApplication.primaryScreen()
+        refresh_rate = screen.refreshRate() if screen else 0
+        self._frame_ms = max(8, int(1000 / refresh_rate)) if refresh_rate > 0 else 16
+        self._paint_timer = QTimer(self)
+        self._paint_timer.setSingleShot(True)
+        self._paint_timer.setInterval(self._frame_ms)
+        self._paint_timer.timeout.connect(self._flush_update)
+
+    def update(self, *args):
+        """Coalesce repaint requests to at most one per refresh interval."""
+        if not self._paint_timer.isActive():
+            self._paint_timer.start()
+
+    def _flush_update(self):
+        """Issue the coalesced repaint."""
+        super().update()
+
     def set_rect(self, rect: QRect, animate: bool = True):
         """Update the preview rectangle with optional animation."""
         if animate and self.isVisible():
-            self.geometry_animation.setStartValue(self.geometry())
-            self.geometry_animation.setEndValue(rect)
-            self.geometry_animation.start()
+            # Already animating toward this rect; nothing to restart
+            if (self._anim_group.state() == QParallelAnimationGroup.Running
+                    and self.geometry_animation.endValue() == rect):
+                self.target_rect = rect
+                return
+
+            # A few pixels of motion over 150ms is imperceptible; just set
+            # the geometry instead of paying for an animation per cursor step
+            old = self.geometry()
+            delta = (abs(rect.x() - old.x()) + abs(rect.y() - old.y())
+                     + abs(rect.width() - old.width())
+                     + abs(rect.height() - old.height()))
+            if delta > 8:
+                # The animation repaints on every geometry tick already
+                self._anim_group.stop()
+                self.geometry_animation.setStartValue(old)
+                self.geometry_animation.setEndValue(rect)
+                self._hold_fade()
+                self._anim_group.start()
+            else:
+                if self._anim_group.state() == QParallelAnimationGroup.Running:
+                    # Let an in-flight fade keep running; just park the
+                    # geometry leg at the new rect
+                    self._hold_geometry(rect)
+                self.setGeometry(rect)
+                self.update()
         else:
             self.setGeometry(rect)
-        
+            self.update()
+
         self.target_rect = rect
-        self.update()
     
+    def _hold_fade(self):
+        """Freeze the fade leg at its current opacity for the next run."""
+        opacity = self.fade_effect.opacity()
+        self.fade_animation.setStartValue(opacity)
+        self.fade_animation.setEndValue(opacity)
+
+    def _hold_geometry(self, rect: QRect = None):
+        """Freeze the geometry leg at a rect for the next run."""
+        rect = rect if rect is not None else self.geometry()
+        self.geometry_animation.setStartValue(rect)
+        self.geometry_animation.setEndValue(rect)
+
     def show_preview(self):
         """Show the preview with fade in animation."""
-        self.fade_animation.stop()
+        self._anim_group.stop()
         self.fade_animation.setStartValue(0)
         self.fade_animation.setEndValue(self.opacity)
+        self._hold_geometry()
         self.show()
-        self.fade_animation.start()
-    
+        self._anim_group.start()
+
     def hide_preview(self):
         """Hide the preview with fade out animation."""
-        self.fade_animation.stop()
+        self._anim_group.stop()
         self.fade_animation.setStartValue(self.opacity)
         self.fade_animation.setEndValue(0)
-        self.fade_animation.finished.connect(self.hide)
-        self.fade_animation.start()
+        self._hold_geometry()
+        self._anim_group.start()
+
+    def _on_fade_finished(self):
+        """Hide the widget once a fade-out completes."""
+        if self.fade_animation.endValue() == 0:
+            self.hide()
     
     def set_color(self, color: QColor):
         """Set the preview color."""
@@ -65,60 +147,101 @@ class PreviewRect(QWidget):
     
     def set_opacity(self, opacity: float):
         """Set the preview opacity."""
-        self.opacity = max(0.0, min(1.0, opacity))
+        clamped = max(0.0, min(1.0, opacity))
+        if clamped == self.opacity:
+            # setOpacity on the effect invalidates and repaints even for
+            # the same value; bulk settings applies re-emit unchanged ones
+            return
+
+        self.opacity = clamped
         if self.isVisible():
-            self.fade_effect.setOpacity(self.opacity)
+            self.fade_effect.setOpacity(clamped)
     
-    def paintEvent(self, event):
-        """Draw the preview rectangle."""
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        
-        # Create rounded rectangle path
+    def resizeEvent(self, event):
+        """Re-mask the widget to its visible ring at the new size."""
+        super().resizeEvent(event)
+        self._update_mask()
+
+    def _update_mask(self):
+        """Mask the widget to the border/corner ring.
+
+        Only a thin outline and the corner marks are ever painted, so
+        masking out the hollow center lets the window manager skip alpha
+        compositing the interior on every frame.
+        """
+        ring = self.corner_radius + self.border_width
+        outer = QRegion(self.rect())
+        inner = QRegion(self.rect().adjusted(ring, ring, -ring, -ring))
+        self.setMask(outer.subtracted(inner))
+
+    def _rebuild_paint_cache(self):
+        """Rebuild the cached path, pens and colors for the current state."""
+        inset = self.border_width / 2
         path = QPainterPath()
         path.addRoundedRect(
-            self.rect().adjusted(
-                self.border_width/2,
-                self.border_width/2,
-                -self.border_width/2,
-                -self.border_width/2
-            ),
+            QRectF(self.rect()).adjusted(inset, inset, -inset, -inset),
             self.corner_radius,
             self.corner_radius
         )
-        
-        # Draw semi-transparent fill
+
         fill_color = QColor(self.color)
         fill_color.setAlpha(int(40 * self.opacity))
-        painter.fillPath(path, fill_color)
-        
-        # Draw border
-        pen = QPen(self.color)
-        pen.setWidth(self.border_width)
-        painter.setPen(pen)
-        painter.drawPath(path)
-        
-        # Draw corner indicators
-        corner_size = 16
+
         corner_color = QColor(self.color)
         corner_color.setAlpha(int(255 * self.opacity))
-        pen.setColor(corner_color)
-        painter.setPen(pen)
-        
-        # Top-left corner
-        painter.drawLine(0, corner_size, 0, 0)
-        painter.drawLine(0, 0, corner_size, 0)
-        
-        # Top-right corner
-        painter.drawLine(self.width() - corner_size, 0, self.width(), 0)
-        painter.drawLine(self.width(), 0, self.width(), corner_size)
-        
-        # Bottom-left corner
-        painter.drawLine(0, self.height() - corner_size, 0, self.height())
-        painter.drawLine(0, self.height(), corner_size, self.height())
-        
-        # Bottom-right corner
-        painter.drawLine(self.width() - corner_size, self.height(), 
-                        self.width(), self.height())
-        painter.drawLine(self.width(), self.height() - corner_size,
-                        self.width(), self.height())
\ No newline at end of file
+
+        border_pen = QPen(self.color)
+        border_pen.setWidth(self.border_width)
+        corner_pen = QPen(corner_color)
+        corner_pen.setWidth(self.border_width)
+
+        # Corner indicator segments, grouped per corner with the rect used
+        # for dirty-region culling
+        cs = 16
+        w = self.width()
+        h = self.height()
+        corner_lines = (
+            (QRect(0, 0, cs, cs),
+             [QLine(0, cs, 0, 0), QLine(0, 0, cs, 0)]),
+            (QRect(w - cs, 0, cs, cs),
+             [QLine(w - cs, 0, w, 0), QLine(w, 0, w, cs)]),
+            (QRect(0, h - cs, cs, cs),
+             [QLine(0, h - cs, 0, h), QLine(0, h, cs, h)]),
+            (QRect(w - cs, h - cs, cs, cs),
+             [QLine(w - cs, h, w, h), QLine(w, h - cs, w, h)]),
+        )
+
+        self._border_path = path
+        self._border_pen = border_pen
+        self._corner_pen = corner_pen
+        self._fill_color = fill_color
+        self._corner_lines = corner_lines
+
+    def paintEvent(self, event):
+        """Draw the preview rectangle."""
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        # Rebuild derived paint state only when the inputs change; the
+        # steady-state animation frames just reuse it
+        key = (self.width(), self.height(), self.border_width,
+               self.corner_radius, self.color.rgba(), self.opacity)
+        if key != self._cache_key:
+            self._rebuild_paint_cache()
+            self._cache_key = key
+
+        # Draw semi-transparent fill
+        painter.fillPath(self._border_path, self._fill_color)
+
+        # Draw border
+        painter.setPen(self._border_pen)
+        painter.drawPath(self._border_path)
+
+        # Draw corner indicators from the cached segments, skipping corners
+        # outside the dirty region (partial exposes during the geometry
+        # animation are common)
+        dirty = event.region()
+        painter.setPen(self._corner_pen)
+        for corner_rect, lines in self._corner_lines:
+            if dirty.intersects(corner_rect):
+                painter.drawLines(lines)
\ No newline at end of file
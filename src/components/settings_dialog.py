@@ -1,59 +1,105 @@
-from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QGridLayout, 
+from PyQt5.QtWidgets import (QDialog, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
                             QLabel, QSpinBox, QSlider, QPushButton, QTabWidget,
                             QColorDialog, QCheckBox, QComboBox, QGroupBox)
-from PyQt5.QtCore import Qt, pyqtSignal, QSize
-from PyQt5.QtGui import QColor, QIcon, QPainter, QPixmap
+from PyQt5.QtCore import Qt, pyqtSignal, QSize, QTimer
+from PyQt5.QtGui import QColor, QIcon, QPainter, QPen, QPixmap
+from enum import IntEnum
+
+class Setting(IntEnum):
+    """Index of each color button in SettingsDialog.color_buttons."""
+    GRID_COLOR = 0
+    HOVER_COLOR = 1
+    ACTIVE_CELL_COLOR = 2
+    PREVIEW_COLOR = 3
+    SUGGESTION_COLOR = 4
+
+# Settings keys in Setting order
+SETTING_KEYS = ("grid_color", "hover_color", "active_cell_color",
+                "preview_color", "suggestion_color")
+
+# Easing curves offered for animations; the dict gives O(1) lookup of the
+# combo index for the saved setting
+_EASING_OPTIONS = ("Linear", "OutQuad", "InOutQuad", "OutCubic", "OutElastic")
+_EASING_INDEX = {name: i for i, name in enumerate(_EASING_OPTIONS)}
+
+# One stylesheet parsed once at the dialog root; per-button setStyleSheet
+# calls each rerun the QSS parser and repolish the widget subtree
+_SETTINGS_QSS = """
+    QPushButton#save {
+        background-color: #4CAF50;
+        color: white;
+        border: none;
+        padding: 8px 16px;
+        border-radius: 4px;
+    }
+    QPushButton#save:hover {
+        background-color: #45a049;
+    }
+    QPushButton#cancel {
+        background-color: #f44336;
+        color: white;
+        border: none;
+        padding: 8px 16px;
+        border-radius: 4px;
+    }
+    QPushButton#cancel:hover {
+        background-color: #d32f2f;
+    }
+"""
 
 class ColorButton(QPushButton):
     """Custom button for color selection with preview."""
-    
+
+    _CHECKERBOARD = None  # Shared transparency pattern, built on first use
+
+    _BORDER_PEN = None
+    _HOVER_PEN = None
+
     def __init__(self, color="#FFFFFF", parent=None):
         super().__init__(parent)
         self.color = QColor(color)
         self.setFixedSize(40, 24)
         self.setToolTip("Click to change color")
         self.setCursor(Qt.PointingHandCursor)
-        self.update_style()
-    
-    def update_style(self):
-        """Update button style to show current color."""
-        self.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {self.color.name()};
-                border: 1px solid #555555;
-                border-radius: 4px;
-            }}
-            QPushButton:hover {{
-                border: 1px solid #FFFFFF;
-            }}
-        """)
-    
+
+        # The swatch is painted directly in paintEvent; rebuilding a QSS
+        # string per color change would rerun the stylesheet parser and
+        # repolish the widget every time
+        if ColorButton._BORDER_PEN is None:
+            ColorButton._BORDER_PEN = QPen(QColor("#555555"))
+            ColorButton._HOVER_PEN = QPen(QColor("#FFFFFF"))
+
     def set_color(self, color):
         """Set the button's color."""
         self.color = QColor(color)
-        self.update_style()
-    
+        self.update()
+
     def get_color(self):
         """Get the current color."""
         return self.color.name()
-    
+
     def paintEvent(self, event):
         """Draw color preview."""
-        super().paintEvent(event)
-        
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(self._HOVER_PEN if self.underMouse() else self._BORDER_PEN)
+        painter.setBrush(self.color)
+        painter.drawRoundedRect(self.rect().adjusted(0, 0, -1, -1), 4, 4)
+
         # Add a checkerboard pattern for transparency
         if self.color.alpha() < 255:
-            painter = QPainter(self)
-            painter.setRenderHint(QPainter.Antialiasing)
-            
-            checkerboard = QPixmap(16, 16)
-            checkerboard.fill(Qt.white)
-            painter.fillRect(0, 0, 8, 8, Qt.lightGray)
-            painter.fillRect(8, 8, 8, 8, Qt.lightGray)
-            
+            # The pattern is constant, so every button shares one pixmap
+            if ColorButton._CHECKERBOARD is None:
+                checkerboard = QPixmap(16, 16)
+                checkerboard.fill(Qt.white)
+                pattern_painter = QPainter(checkerboard)
+                pattern_painter.fillRect(0, 0, 8, 8, Qt.lightGray)
+                pattern_painter.fillRect(8, 8, 8, 8, Qt.lightGray)
+                pattern_painter.end()
+                ColorButton._CHECKERBOARD = checkerboard
+
             painter.setOpacity(0.3)
-            painter.drawPixmap(self.rect(), checkerboard)
-            painter.setOpacity(1.0)
+            painter.drawTiledPixmap(self.rect(), ColorButton._CHECKERBOARD)
 
 class SettingsDialog(QDialog):
     """Dialog for adjusting application settings."""
@@ -65,11 +111,20 @@ class SettingsDialog(QDialog):
         self.setWindowTitle("Settings")
         self.setMinimumSize(500, 400)
         self.setWindowFlags(Qt.Dialog | Qt.WindowTitleHint | Qt.WindowCloseButtonHint)
-        
+        self.setStyleSheet(_SETTINGS_QSS)
+
         # Initialize settings
         self.settings = settings or {}
         self.modified_settings = {}
-        
+
+        # Sliders emit valueChanged per pixel of drag; changes land in
+        # _pending and fold into modified_settings once the burst settles
+        self._pending = {}
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(100)
+        self._flush_timer.timeout.connect(self._flush_pending)
+
         # Setup UI
         self.init_ui()
         self.load_settings()
@@ -80,52 +135,52 @@ class SettingsDialog(QDialog):
         
         # Create tabs
         self.tabs = QTabWidget()
-        
-        # Add tabs
-        self.tabs.addTab(self.create_appearance_tab(), "Appearance")
-        self.tabs.addTab(self.create_grid_tab(), "Grid")
-        self.tabs.addTab(self.create_behavior_tab(), "Behavior")
-        
+
+        # Only the default tab is built up front; the others start as empty
+        # placeholders that are materialized on first activation
+        self._tab_factories = {}
+        tab_specs = (
+            (self.create_appearance_tab, "Appearance"),
+            (self.create_grid_tab, "Grid"),
+            (self.create_behavior_tab, "Behavior"),
+        )
+        for index, (factory, label) in enumerate(tab_specs):
+            if index == 0:
+                self.tabs.addTab(factory(), label)
+            else:
+                self.tabs.addTab(QWidget(), label)
+                self._tab_factories[index] = factory
+        self.tabs.currentChanged.connect(self._ensure_tab)
+
         main_layout.addWidget(self.tabs)
         
         # Buttons
         button_layout = QHBoxLayout()
         
         self.save_btn = QPushButton("Save")
+        self.save_btn.setObjectName("save")
         self.save_btn.clicked.connect(self.save_settings)
-        self.save_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-        """)
-        
+
         self.cancel_btn = QPushButton("Cancel")
+        self.cancel_btn.setObjectName("cancel")
         self.cancel_btn.clicked.connect(self.reject)
-        self.cancel_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #f44336;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #d32f2f;
-            }
-        """)
         
         button_layout.addWidget(self.save_btn)
         button_layout.addWidget(self.cancel_btn)
         
         main_layout.addLayout(button_layout)
     
+    def _ensure_tab(self, index):
+        """Replace a placeholder tab with its real contents on first use."""
+        factory = self._tab_factories.pop(index, None)
+        if factory is None:
+            return
+
+        label = self.tabs.tabText(index)
+        self.tabs.removeTab(index)
+        self.tabs.insertTab(index, factory(), label)
+        self.tabs.setCurrentIndex(index)
+
     def create_appearance_tab(self):
         """Create the appearance settings tab."""
         tab = QWidget()
@@ -135,23 +190,26 @@ class SettingsDialog(QDialog):
         color_group = QGroupBox("Colors")
         color_layout = QGridLayout()
         
-        # Define color settings to add
-        color_settings = [
-            ("Grid Color", "grid_color", "#FFFFFF"),
-            ("Hover Color", "hover_color", "#4CAF50"),
-            ("Active Cell Color", "active_cell_color", "#FFA500"),
-            ("Preview Color", "preview_color", "#00FF00"),
-            ("Suggestion Color", "suggestion_color", "#4CAF50")
-        ]
-        
-        self.color_buttons = {}
-        
-        for row, (label_text, setting_key, default_color) in enumerate(color_settings):
+        # Labels and defaults in Setting order
+        color_settings = (
+            ("Grid Color", "#FFFFFF"),
+            ("Hover Color", "#4CAF50"),
+            ("Active Cell Color", "#FFA500"),
+            ("Preview Color", "#00FF00"),
+            ("Suggestion Color", "#4CAF50")
+        )
+
+        # Indexed by the Setting enum; list indexing beats dict hashing in
+        # the save/update paths
+        self.color_buttons = [None] * len(SETTING_KEYS)
+
+        for row, (label_text, default_color) in enumerate(color_settings):
+            setting_key = SETTING_KEYS[row]
             label = QLabel(f"{label_text}:")
             color_button = ColorButton(self.settings.get(setting_key, default_color))
             color_button.clicked.connect(lambda _, k=setting_key, b=color_button: self.pick_color(k, b))
-            
-            self.color_buttons[setting_key] = color_button
+
+            self.color_buttons[Setting(row)] = color_button
             color_layout.addWidget(label, row, 0)
             color_layout.addWidget(color_button, row, 1)
         
@@ -197,11 +255,9 @@ class SettingsDialog(QDialog):
         # Easing curve selection
         easing_label = QLabel("Easing Curve:")
         self.easing_combo = QComboBox()
-        easing_options = ["Linear", "OutQuad", "InOutQuad", "OutCubic", "OutElastic"]
-        self.easing_combo.addItems(easing_options)
+        self.easing_combo.addItems(_EASING_OPTIONS)
         current_easing = self.settings.get("animation_easing", "OutCubic")
-        index = easing_options.index(current_easing) if current_easing in easing_options else 3
-        self.easing_combo.setCurrentIndex(index)
+        self.easing_combo.setCurrentIndex(_EASING_INDEX.get(current_easing, 3))
         self.easing_combo.currentTextChanged.connect(
             lambda t: self.update_setting("animation_easing", t))
         
@@ -379,8 +435,14 @@ class SettingsDialog(QDialog):
             self.update_setting(setting_key, hex_color)
     
     def update_setting(self, key, value):
-        """Update a setting in the modified settings dictionary."""
-        self.modified_settings[key] = value
+        """Queue a setting change, debouncing bursts from drags."""
+        self._pending[key] = value
+        self._flush_timer.start()
+
+    def _flush_pending(self):
+        """Fold the queued changes into the modified settings."""
+        self.modified_settings.update(self._pending)
+        self._pending.clear()
     
     def load_settings(self):
         """Load current settings into the UI elements."""
@@ -390,6 +452,10 @@ class SettingsDialog(QDialog):
     
     def save_settings(self):
         """Save the modified settings and close."""
+        # Take any changes still sitting in the debounce window
+        self._flush_timer.stop()
+        self._flush_pending()
+
         if self.modified_settings:
             self.settings_changed.emit(self.modified_settings)
         self.accept()
\ No newline at end of file
@@ -1,7 +1,63 @@
 from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, 
                              QLabel, QPushButton, QGraphicsOpacityEffect)
 from PyQt5.QtCore import Qt, QPropertyAnimation, QEasingCurve, pyqtSignal
-from PyQt5.QtGui import QPainter, QPainterPath, QColor, QFont
+from PyQt5.QtGui import QPainter, QPainterPath, QColor, QFont, QPixmap
+
+# One stylesheet parsed once at the dialog root; per-widget setStyleSheet
+# calls each rerun the QSS parser and repolish the widget subtree
+_DIALOG_QSS = """
+    QLabel#title {
+        color: white;
+        font-size: 18px;
+        font-weight: bold;
+    }
+    QLabel#message {
+        color: rgba(255, 255, 255, 0.8);
+        font-size: 14px;
+    }
+    QPushButton#saveBtn {
+        background-color: #4CAF50;
+        color: white;
+        border: none;
+        padding: 8px 16px;
+        border-radius: 4px;
+        font-size: 14px;
+    }
+    QPushButton#saveBtn:hover {
+        background-color: #45a049;
+    }
+    QPushButton#saveBtn:pressed {
+        background-color: #3d8b40;
+    }
+    QPushButton#discardBtn {
+        background-color: transparent;
+        color: #ff5252;
+        border: 1px solid #ff5252;
+        padding: 8px 16px;
+        border-radius: 4px;
+        font-size: 14px;
+    }
+    QPushButton#discardBtn:hover {
+        background-color: rgba(255, 82, 82, 0.1);
+    }
+    QPushButton#discardBtn:pressed {
+        background-color: rgba(255, 82, 82, 0.2);
+    }
+    QPushButton#cancelBtn {
+        background-color: transparent;
+        color: white;
+        border: 1px solid rgba(255, 255, 255, 0.3);
+        padding: 8px 16px;
+        border-radius: 4px;
+        font-size: 14px;
+    }
+    QPushButton#cancelBtn:hover {
+        background-color: rgba(255, 255, 255, 0.1);
+    }
+    QPushButton#cancelBtn:pressed {
+        background-color: rgba(255, 255, 255, 0.2);
+    }
+"""
 
 class UnsavedDialog(QDialog):
     """Modern dialog for handling unsaved changes."""
@@ -12,6 +68,10 @@ class UnsavedDialog(QDialog):
         super().__init__(parent)
         self.setWindowFlags(Qt.FramelessWindowHint | Qt.Dialog)
         self.setAttribute(Qt.WA_TranslucentBackground)
+        # paintEvent covers the whole widget, so Qt can skip its own
+        # background erase before every paint
+        self.setAttribute(Qt.WA_OpaquePaintEvent, True)
+        self.setAttribute(Qt.WA_NoSystemBackground, True)
         self.setModal(True)
         
         # Setup fade effect
@@ -21,98 +81,52 @@ class UnsavedDialog(QDialog):
         self.fade_animation = QPropertyAnimation(self.fade_effect, b"opacity")
         self.fade_animation.setDuration(200)
         self.fade_animation.setEasingCurve(QEasingCurve.OutCubic)
-        
+        # Connected once; closeEvent must not reconnect per call or the
+        # slot fires once per past close on every fade
+        self.fade_animation.finished.connect(self._on_fade_finished)
+        self._closing = False
+
+        # Shadow and panel rasterized once per size; the fade animation
+        # repaints every tick and must not redo ten antialiased path fills
+        self._panel_pixmap = None
+
         self.setup_ui()
     
     def setup_ui(self):
         """Setup the dialog UI."""
+        self.setStyleSheet(_DIALOG_QSS)
+
         layout = QVBoxLayout(self)
         layout.setContentsMargins(24, 24, 24, 24)
         layout.setSpacing(16)
-        
+
         # Title
         title = QLabel("Unsaved Changes")
-        title.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 18px;
-                font-weight: bold;
-            }
-        """)
+        title.setObjectName("title")
         layout.addWidget(title)
-        
+
         # Message
         message = QLabel(
             "You have unsaved changes in the current layout.\n"
             "Would you like to save them before continuing?"
         )
-        message.setStyleSheet("""
-            QLabel {
-                color: rgba(255, 255, 255, 0.8);
-                font-size: 14px;
-            }
-        """)
+        message.setObjectName("message")
         layout.addWidget(message)
-        
+
         # Buttons
         button_layout = QHBoxLayout()
         button_layout.setSpacing(8)
-        
+
         save_btn = QPushButton("Save Changes")
-        save_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            QPushButton:pressed {
-                background-color: #3d8b40;
-            }
-        """)
+        save_btn.setObjectName("saveBtn")
         save_btn.clicked.connect(lambda: self.handle_decision(True))
-        
+
         discard_btn = QPushButton("Discard")
-        discard_btn.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                color: #ff5252;
-                border: 1px solid #ff5252;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: rgba(255, 82, 82, 0.1);
-            }
-            QPushButton:pressed {
-                background-color: rgba(255, 82, 82, 0.2);
-            }
-        """)
+        discard_btn.setObjectName("discardBtn")
         discard_btn.clicked.connect(lambda: self.handle_decision(False))
-        
+
         cancel_btn = QPushButton("Cancel")
-        cancel_btn.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                color: white;
-                border: 1px solid rgba(255, 255, 255, 0.3);
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: rgba(255, 255, 255, 0.1);
-            }
-            QPushButton:pressed {
-                background-color: rgba(255, 255, 255, 0.2);
-            }
-        """)
+        cancel_btn.setObjectName("cancelBtn")
         cancel_btn.clicked.connect(self.reject)
         
         button_layout.addWidget(save_btn)
@@ -129,46 +143,89 @@ class UnsavedDialog(QDialog):
     def showEvent(self, event):
         """Show dialog with fade in animation."""
         super().showEvent(event)
+        self._closing = False
         self.fade_animation.setStartValue(0)
         self.fade_animation.setEndValue(1)
         self.fade_animation.start()
-    
+
     def closeEvent(self, event):
         """Close dialog with fade out animation."""
+        if self._closing:
+            # Second pass after the fade-out completed
+            event.accept()
+            return
+
+        self._closing = True
         self.fade_animation.setStartValue(1)
         self.fade_animation.setEndValue(0)
-        self.fade_animation.finished.connect(self.close)
         self.fade_animation.start()
         event.ignore()
+
+    def _on_fade_finished(self):
+        """Finish closing once the fade-out completes."""
+        if self.fade_animation.endValue() == 0:
+            self.close()
     
-    def paintEvent(self, event):
-        """Draw the dialog background."""
-        painter = QPainter(self)
+    def resizeEvent(self, event):
+        """Invalidate the pre-rendered panel when the dialog resizes."""
+        super().resizeEvent(event)
+        self._panel_pixmap = None
+
+    def _rebuild_panel_pixmap(self):
+        """Rasterize the shadow stack and panel background once."""
+        pixmap = QPixmap(self.size())
+        pixmap.fill(Qt.transparent)
+
+        painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.Antialiasing)
-        
-        # Draw semi-transparent backdrop
-        painter.fillRect(self.rect(), QColor(0, 0, 0, 128))
-        
-        # Draw dialog background
+        painter.setPen(Qt.NoPen)
+
+        content_rect = self._content_rect()
         path = QPainterPath()
-        content_rect = self.rect().adjusted(
-            self.width()//4, self.height()//4,
-            -self.width()//4, -self.height()//4
-        )
         path.addRoundedRect(content_rect, 12, 12)
-        
-        # Draw shadow
+
+        # Draw shadow, reusing one path object across the layers
         shadow_color = QColor(0, 0, 0, 50)
+        shadow_path = QPainterPath()
         for i in range(10):
-            painter.setPen(Qt.NoPen)
             painter.setBrush(shadow_color)
-            shadow_path = QPainterPath()
+            shadow_path.clear()
             shadow_path.addRoundedRect(
-                content_rect.adjusted(-i, -i, i, i), 
+                content_rect.adjusted(-i, -i, i, i),
                 12, 12
             )
             painter.drawPath(shadow_path)
             shadow_color.setAlpha(max(0, shadow_color.alpha() - 5))
-        
+
         # Draw main background
-        painter.fillPath(path, QColor(42, 42, 42))
\ No newline at end of file
+        painter.fillPath(path, QColor(42, 42, 42))
+        painter.end()
+
+        self._panel_pixmap = pixmap
+
+    def _content_rect(self):
+        """Rect of the dialog panel inside the backdrop."""
+        return self.rect().adjusted(
+            self.width()//4, self.height()//4,
+            -self.width()//4, -self.height()//4
+        )
+
+    def paintEvent(self, event):
+        """Draw the dialog background."""
+        painter = QPainter(self)
+
+        # Draw semi-transparent backdrop. With the system erase skipped the
+        # fill must replace the stale backing store, not blend over it
+        painter.setCompositionMode(QPainter.CompositionMode_Source)
+        painter.fillRect(self.rect(), QColor(0, 0, 0, 128))
+        painter.setCompositionMode(QPainter.CompositionMode_SourceOver)
+
+        # Skip the shadow and panel when the damaged area only touches the
+        # backdrop (10px covers the widest shadow layer)
+        if not event.rect().intersects(self._content_rect().adjusted(-10, -10, 10, 10)):
+            return
+
+        # Blit the pre-rendered shadow and panel
+        if self._panel_pixmap is None:
+            self._rebuild_panel_pixmap()
+        painter.drawPixmap(0, 0, self._panel_pixmap)
\ No newline at end of file
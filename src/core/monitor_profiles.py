@@ -1,11 +1,54 @@
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, List, Optional, Set, Tuple
 import json
-from PyQt5.QtCore import QObject, pyqtSignal, QRect
+import os
+
+try:
+    # Optional: Rust JSON codec, several times faster than the stdlib for
+    # both directions. Profiles load/save fine without it
+    import orjson
+except ImportError:
+    orjson = None
+
+from PyQt5.QtCore import QObject, pyqtSignal, QRect, QTimer
+from PyQt5.QtGui import QGuiApplication
 from utils.window_utils import get_monitor_info
 from models.monitor import MonitorInfo, MonitorGridConfig
 
-@dataclass
+
+# Zone layouts by aspect-ratio bucket, folded to module-level constants
+# and shared by reference across every grid config that uses them; treat
+# as read-only
+_ZONES_SUPER_ULTRAWIDE = (
+    (0.0, 0.25),   # Left quarter
+    (0.25, 0.75),  # Center half
+    (0.75, 1.0)    # Right quarter
+)
+_ZONES_ULTRAWIDE = (
+    (0.0, 0.33),   # Left third
+    (0.33, 0.67),  # Center third
+    (0.67, 1.0)    # Right third
+)
+_ZONES_WIDESCREEN = (
+    (0.0, 0.5),    # Left half
+    (0.5, 1.0)     # Right half
+)
+
+
+@lru_cache(maxsize=1)
+def _cached_monitor_info():
+    """Memoized get_monitor_info; the physical setup rarely changes.
+
+    Enumerating monitors is a Win32 round trip per display, and profile
+    creation paths call it back to back. Cleared on Qt's screen
+    added/removed signals (wired up in MonitorProfileManager.__init__).
+    """
+    return get_monitor_info()
+
+
+@dataclass(slots=True)
 class MonitorProfile:
     """A collection of monitor configurations."""
     name: str
@@ -23,59 +66,160 @@ class MonitorProfileManager(QObject):
         super().__init__()
         self.config_path = config_path
         self.profiles: Dict[str, MonitorProfile] = {}
+        # Raw profile dicts parsed from disk but not yet built into
+        # objects; hydrated on first access (see _materialize)
+        self._profile_blobs: Dict[str, dict] = {}
         self.current_profile: Optional[str] = None
+
+        # Mutations mark profiles dirty and flush once through a
+        # zero-interval timer, so a burst of changes costs one write and
+        # one profile_updated per touched profile
+        self._dirty_profiles: Set[str] = set()
+        self._needs_save = False
+        self._batch_depth = 0
+        # Hash of the last payload written; see save_profiles
+        self._last_payload_hash: Optional[int] = None
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(0)
+        self._save_timer.timeout.connect(self._flush)
+
+        # Monitor topology changes must drop the memoized enumeration
+        app = QGuiApplication.instance()
+        if app is not None:
+            app.screenAdded.connect(
+                lambda _: _cached_monitor_info.cache_clear())
+            app.screenRemoved.connect(
+                lambda _: _cached_monitor_info.cache_clear())
+
         self.load_profiles()
     
     def load_profiles(self):
         """Load monitor profiles from config file."""
         try:
-            with open(self.config_path, 'r') as f:
-                data = json.load(f)
+            # One whole-file read, then parse from the buffer; json.load's
+            # incremental text decoding is the slow path here
+            with open(self.config_path, 'rb') as f:
+                raw = f.read()
+            data = orjson.loads(raw) if orjson else json.loads(raw)
             
-            for profile_data in data.get('profiles', []):
-                monitors = {}
-                for monitor_data in profile_data.get('monitors', {}).values():
-                    # Create grid configuration
-                    grid_config = MonitorGridConfig(
-                        columns=monitor_data['grid'].get('columns', 6),
-                        rows=monitor_data['grid'].get('rows', 4),
-                        subdivisions=monitor_data['grid'].get('subdivisions', False),
-                        ultrawide_zones=monitor_data['grid'].get('ultrawide_zones')
-                    )
-                    
-                    # Create monitor info
-                    monitors[monitor_data['id']] = MonitorInfo(
-                        id=monitor_data['id'],
-                        name=monitor_data['name'],
-                        work_area=QRect(*monitor_data['work_area']),
-                        is_primary=monitor_data['is_primary'],
-                        is_ultrawide=monitor_data.get('is_ultrawide', False),
-                        grid_config=grid_config
-                    )
-                
-                self.profiles[profile_data['name']] = MonitorProfile(
-                    name=profile_data['name'],
-                    monitors=monitors,
-                    is_active=profile_data.get('is_active', False)
-                )
-            
-            # Set current profile
-            for name, profile in self.profiles.items():
-                if profile.is_active:
+            # Keep the raw dicts and build objects on demand; only the
+            # active profile is needed at startup, the rest hydrate on
+            # first access
+            self._profile_blobs = {
+                p['name']: p for p in data.get('profiles', [])
+            }
+
+            for name, blob in self._profile_blobs.items():
+                if blob.get('is_active', False):
                     self.current_profile = name
                     break
-            
-            if not self.profiles:
+
+            # Only the picked profile is active; stale flags in the other
+            # blobs would otherwise round-trip through save_profiles
+            for name, blob in self._profile_blobs.items():
+                blob['is_active'] = name == self.current_profile
+
+            if self.current_profile:
+                self._materialize(self.current_profile)
+
+            if not self._profile_blobs and not self.profiles:
                 self.create_default_profile()
-                
+
         except FileNotFoundError:
             self.create_default_profile()
+
+    def _materialize(self, name: str) -> Optional[MonitorProfile]:
+        """Build the MonitorProfile object for a stored raw dict."""
+        blob = self._profile_blobs.pop(name, None)
+        if blob is None:
+            return None
+
+        monitors = {}
+        for monitor_data in blob.get('monitors', {}).values():
+            # Create grid configuration
+            grid_config = MonitorGridConfig(
+                columns=monitor_data['grid'].get('columns', 6),
+                rows=monitor_data['grid'].get('rows', 4),
+                subdivisions=monitor_data['grid'].get('subdivisions', False),
+                ultrawide_zones=monitor_data['grid'].get('ultrawide_zones')
+            )
+
+            # Create monitor info
+            monitors[monitor_data['id']] = MonitorInfo(
+                id=monitor_data['id'],
+                name=monitor_data['name'],
+                work_area=QRect(*monitor_data['work_area']),
+                is_primary=monitor_data['is_primary'],
+                is_ultrawide=monitor_data.get('is_ultrawide', False),
+                grid_config=grid_config
+            )
+
+        profile = MonitorProfile(
+            name=blob['name'],
+            monitors=monitors,
+            is_active=blob.get('is_active', False)
+        )
+        self.profiles[name] = profile
+        return profile
+
+    def get_profile(self, name: str) -> Optional[MonitorProfile]:
+        """Get a profile by name, hydrating it if needed."""
+        profile = self.profiles.get(name)
+        if profile is None:
+            profile = self._materialize(name)
+        return profile
+
+    def _has_profile(self, name: str) -> bool:
+        """Check whether a profile exists, hydrated or not."""
+        return name in self.profiles or name in self._profile_blobs
+
+    def _mark_dirty(self, name: str, emit: bool = True):
+        """Queue a save and, unless told otherwise, a profile_updated
+        emission for the profile.
+
+        Deletions pass emit=False: the write is still needed, but
+        announcing an update for a name that no longer resolves would
+        hand listeners a dead profile.
+        """
+        if emit:
+            self._dirty_profiles.add(name)
+        self._needs_save = True
+        if self._batch_depth == 0:
+            self._save_timer.start()
+
+    def _flush(self):
+        """Write once and emit for everything marked since the last flush."""
+        if not self._needs_save:
+            return
+
+        self._needs_save = False
+        changed, self._dirty_profiles = self._dirty_profiles, set()
+        self.save_profiles()
+        for name in changed:
+            self.profile_updated.emit(name)
+
+    @contextmanager
+    def batch(self):
+        """Suppress intermediate flushes for a bulk operation.
+
+        Mutations made inside the block are coalesced into a single save
+        and one emission per touched profile when the block exits.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._save_timer.stop()
+                self._flush()
     
     def create_default_profile(self):
         """Create a default profile based on current monitor setup."""
         monitors = {}
-        monitor_info = get_monitor_info()
-        
+        monitor_info = _cached_monitor_info()
+
         for monitor_id, info in monitor_info.items():
             # Calculate aspect ratio
             work_area = info['work_area']
@@ -108,53 +252,76 @@ class MonitorProfileManager(QObject):
         )
         
         self.current_profile = 'Default'
-        self.save_profiles()
+        self._mark_dirty('Default')
     
+    @staticmethod
+    def _monitor_to_dict(monitor: MonitorInfo) -> dict:
+        """Serialize one monitor, hoisting the Qt accessors to locals."""
+        grid = monitor.grid_config
+        return {
+            'id': monitor.id,
+            'name': monitor.name,
+            'work_area': monitor.work_area_tuple,
+            'is_primary': monitor.is_primary,
+            'is_ultrawide': monitor.is_ultrawide,
+            'grid': {
+                'columns': grid.columns,
+                'rows': grid.rows,
+                'subdivisions': grid.subdivisions,
+                'ultrawide_zones': grid.ultrawide_zones
+            }
+        }
+
     def save_profiles(self):
         """Save profiles to config file."""
-        data = {
-            'profiles': []
-        }
-        
-        for profile in self.profiles.values():
-            monitors_data = {}
-            for monitor in profile.monitors.values():
-                monitors_data[monitor.id] = {
-                    'id': monitor.id,
-                    'name': monitor.name,
-                    'work_area': [
-                        monitor.work_area.x(),
-                        monitor.work_area.y(),
-                        monitor.work_area.width(),
-                        monitor.work_area.height()
-                    ],
-                    'is_primary': monitor.is_primary,
-                    'is_ultrawide': monitor.is_ultrawide,
-                    'grid': {
-                        'columns': monitor.grid_config.columns,
-                        'rows': monitor.grid_config.rows,
-                        'subdivisions': monitor.grid_config.subdivisions,
-                        'ultrawide_zones': monitor.grid_config.ultrawide_zones
-                    }
-                }
-            
-            data['profiles'].append({
+        profiles = [
+            {
                 'name': profile.name,
-                'monitors': monitors_data,
+                'monitors': {m.id: self._monitor_to_dict(m)
+                             for m in profile.monitors.values()},
                 'is_active': profile.is_active
-            })
-        
-        with open(self.config_path, 'w') as f:
-            json.dump(data, f, indent=2)
+            }
+            for profile in self.profiles.values()
+        ]
+
+        # Profiles never touched this session are still raw dicts in the
+        # saved format; pass them through as-is
+        profiles.extend(self._profile_blobs.values())
+        data = {'profiles': profiles}
+
+        # Serialize fully in memory, then flush with one write; json.dump
+        # would call f.write once per encoder token
+        if orjson:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(data, indent=2).encode()
+
+        # Skip the disk entirely when nothing observable changed — UI
+        # churn like re-activating the current profile lands here
+        payload_hash = hash(payload)
+        if payload_hash == self._last_payload_hash:
+            return
+
+        # Write a sibling temp file, fsync it, then rename over the real
+        # path; a crash mid-write can't leave the profiles truncated
+        tmp_path = self.config_path + '.tmp'
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, payload)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, self.config_path)
+        self._last_payload_hash = payload_hash
     
     def create_profile(self, name: str) -> bool:
         """Create a new profile based on current monitor setup."""
-        if name in self.profiles:
+        if self._has_profile(name):
             return False
         
         monitors = {}
-        monitor_info = get_monitor_info()
-        
+        monitor_info = _cached_monitor_info()
+
         # Copy settings from current profile if it exists
         current = self.profiles.get(self.current_profile)
         
@@ -172,7 +339,8 @@ class MonitorProfileManager(QObject):
                 )
             else:
                 # Create new monitor config
-                aspect_ratio = info['work_area'].width() / info['work_area'].height()
+                work_area = info['work_area']
+                aspect_ratio = work_area.width() / work_area.height()
                 is_ultrawide = aspect_ratio > 2.0
                 
                 grid_config = MonitorGridConfig(
@@ -196,71 +364,67 @@ class MonitorProfileManager(QObject):
             monitors=monitors,
             is_active=False
         )
-        
-        self.save_profiles()
+
+        self._mark_dirty(name)
         return True
     
     def activate_profile(self, name: str) -> bool:
         """Activate a specific profile."""
-        if name not in self.profiles:
+        if name == self.current_profile:
+            return True
+
+        profile = self.get_profile(name)
+        if profile is None:
             return False
-        
+
         # Deactivate current profile
         if self.current_profile:
             self.profiles[self.current_profile].is_active = False
-        
+
         # Activate new profile
-        self.profiles[name].is_active = True
+        profile.is_active = True
         self.current_profile = name
-        self.save_profiles()
-        
+        self._mark_dirty(name)
+
         self.profile_changed.emit(name)
         return True
     
     def delete_profile(self, name: str) -> bool:
         """Delete a profile."""
-        if name not in self.profiles or len(self.profiles) <= 1:
+        total = len(self.profiles) + len(self._profile_blobs)
+        if not self._has_profile(name) or total <= 1:
             return False
-        
+
         # Can't delete active profile
         if self.current_profile == name:
             return False
-        
-        del self.profiles[name]
-        self.save_profiles()
+
+        self.profiles.pop(name, None)
+        self._profile_blobs.pop(name, None)
+        self._mark_dirty(name, emit=False)
         return True
     
     def rename_profile(self, old_name: str, new_name: str) -> bool:
         """Rename a profile."""
-        if old_name not in self.profiles or new_name in self.profiles:
+        if not self._has_profile(old_name) or self._has_profile(new_name):
             return False
-        
-        profile = self.profiles.pop(old_name)
+
+        profile = self.get_profile(old_name)
+        self.profiles.pop(old_name)
         profile.name = new_name
         self.profiles[new_name] = profile
         
         if self.current_profile == old_name:
             self.current_profile = new_name
-        
-        self.save_profiles()
+
+        self._mark_dirty(new_name)
         return True
     
     @staticmethod
-    def _calculate_zones(aspect_ratio: float) -> List[Tuple[float, float]]:
-        """Calculate optimal zones based on aspect ratio."""
+    def _calculate_zones(aspect_ratio: float) -> Tuple[Tuple[float, float], ...]:
+        """Pick the shared zone constant for an aspect ratio."""
         if aspect_ratio >= 3.5:  # Super ultrawide
-            return [
-                (0.0, 0.25),   # Left quarter
-                (0.25, 0.75),  # Center half
-                (0.75, 1.0)    # Right quarter
-            ]
+            return _ZONES_SUPER_ULTRAWIDE
         elif aspect_ratio >= 2.5:  # Standard ultrawide
-            return [
-                (0.0, 0.33),   # Left third
-                (0.33, 0.67),  # Center third
-                (0.67, 1.0)    # Right third
-            ]
-        return [
-            (0.0, 0.5),    # Left half
-            (0.5, 1.0)     # Right half
-        ]
\ No newline at end of file
+            return _ZONES_ULTRAWIDE
+        return _ZONES_WIDESCREEN
\ No newline at end of file
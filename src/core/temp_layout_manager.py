@@ -1,97 +1,133 @@
-from typing import Dict, Optional, Set
+from typing import Dict, List, Optional, Set
 from PyQt5.QtCore import QObject, pyqtSignal
 from models.temp_layout import TempLayout
 from models.layer import Layer
 
 class TempLayoutManager(QObject):
     """Manages temporary layout states and changes."""
-    
+
     # Signals
     layout_modified = pyqtSignal(str)  # layout_id
     temp_created = pyqtSignal(str)     # layout_id
     temp_discarded = pyqtSignal(str)   # layout_id
     temp_committed = pyqtSignal(str)   # layout_id
-    
+
     def __init__(self):
         super().__init__()
-        self.temp_layouts: Dict[str, TempLayout] = {}
-        self.modified_layouts: Set[str] = set()
-        
+        # Structure-of-arrays storage: _idx maps a layout id to a slot in
+        # the parallel _layouts list and _dirty bitmap, so dirtiness checks
+        # are a single byte read instead of a second hashed set lookup.
+        # Freed slots are zeroed and recycled through _free_slots
+        self._idx: Dict[str, int] = {}
+        self._layouts: List[Optional[TempLayout]] = []
+        self._dirty = bytearray()
+        self._free_slots: List[int] = []
+
+    def _claim_slot(self, temp_layout: TempLayout) -> int:
+        """Store a layout in a recycled or appended slot."""
+        if self._free_slots:
+            slot = self._free_slots.pop()
+            self._layouts[slot] = temp_layout
+        else:
+            slot = len(self._layouts)
+            self._layouts.append(temp_layout)
+            self._dirty.append(0)
+        self._idx[temp_layout.id] = slot
+        return slot
+
+    def _release_slot(self, slot: int):
+        """Clear a slot and put it on the free list."""
+        self._layouts[slot] = None
+        self._dirty[slot] = 0
+        self._free_slots.append(slot)
+
     def create_temp_layout(self, base_layer: Layer, monitor_id: str) -> str:
         """Create a temporary layout based on an existing layer."""
         temp_layout = TempLayout.from_layer(base_layer, monitor_id)
-        self.temp_layouts[temp_layout.id] = temp_layout
+        self._claim_slot(temp_layout)
         self.temp_created.emit(temp_layout.id)
         return temp_layout.id
-    
+
     def modify_temp_layout(self, layout_id: str, **changes) -> bool:
         """Apply changes to a temporary layout."""
-        if layout_id not in self.temp_layouts:
+        slot = self._idx.get(layout_id)
+        if slot is None:
             return False
-            
-        temp_layout = self.temp_layouts[layout_id]
-        temp_layout.apply_changes(changes)
-        
-        self.modified_layouts.add(layout_id)
+
+        self._layouts[slot].apply_changes(changes)
+        self._dirty[slot] = 1
         self.layout_modified.emit(layout_id)
         return True
-    
+
     def commit_temp_layout(self, layout_id: str) -> Optional[Layer]:
         """Convert temporary layout to permanent layer."""
-        if layout_id not in self.temp_layouts:
+        slot = self._idx.pop(layout_id, None)
+        if slot is None:
             return None
-            
-        temp_layout = self.temp_layouts[layout_id]
-        permanent_layer = temp_layout.to_layer()
-        
+
+        permanent_layer = self._layouts[slot].to_layer()
+
         # Clean up temporary state
-        del self.temp_layouts[layout_id]
-        self.modified_layouts.discard(layout_id)
-        
+        self._release_slot(slot)
+
         self.temp_committed.emit(layout_id)
         return permanent_layer
-    
+
     def discard_temp_layout(self, layout_id: str):
         """Discard a temporary layout."""
-        if layout_id in self.temp_layouts:
-            del self.temp_layouts[layout_id]
-            self.modified_layouts.discard(layout_id)
+        slot = self._idx.pop(layout_id, None)
+        if slot is not None:
+            self._release_slot(slot)
             self.temp_discarded.emit(layout_id)
-    
+
     def get_temp_layout(self, layout_id: str) -> Optional[TempLayout]:
         """Get a temporary layout by ID."""
-        return self.temp_layouts.get(layout_id)
-    
+        slot = self._idx.get(layout_id)
+        return self._layouts[slot] if slot is not None else None
+
     def has_unsaved_changes(self, layout_id: str) -> bool:
         """Check if a temporary layout has unsaved changes."""
-        return layout_id in self.modified_layouts
-    
+        slot = self._idx.get(layout_id)
+        return slot is not None and bool(self._dirty[slot])
+
     def preview_changes(self, layout_id: str) -> Optional[Dict]:
         """Get preview of changes in temporary layout."""
-        if layout_id not in self.temp_layouts:
+        slot = self._idx.get(layout_id)
+        if slot is None:
             return None
-            
-        temp_layout = self.temp_layouts[layout_id]
-        return temp_layout.get_changes()
-    
+
+        return self._layouts[slot].get_changes()
+
     def revert_changes(self, layout_id: str) -> bool:
         """Revert changes in a temporary layout."""
-        if layout_id not in self.temp_layouts:
+        slot = self._idx.get(layout_id)
+        if slot is None:
             return False
-            
-        temp_layout = self.temp_layouts[layout_id]
-        temp_layout.revert_changes()
-        
-        self.modified_layouts.discard(layout_id)
+
+        self._layouts[slot].revert_changes()
+        self._dirty[slot] = 0
         self.layout_modified.emit(layout_id)
         return True
-    
+
+    def modified_count(self) -> int:
+        """Count modified temporary layouts without allocating."""
+        # Freed slots are zeroed, so the bitmap sum is exact
+        return sum(self._dirty)
+
+    def iter_modified(self):
+        """Iterate IDs of modified temporary layouts without copying."""
+        return (layout_id for layout_id, slot in self._idx.items()
+                if self._dirty[slot])
+
     def get_modified_layouts(self) -> Set[str]:
-        """Get IDs of all modified temporary layouts."""
-        return self.modified_layouts.copy()
-    
+        """Get IDs of all modified temporary layouts.
+
+        Allocates a fresh set per call; pollers that only need the count
+        or a single pass should use modified_count/iter_modified instead.
+        """
+        return set(self.iter_modified())
+
     def cleanup(self):
         """Clean up all temporary layouts."""
-        layout_ids = list(self.temp_layouts.keys())
-        for layout_id in layout_ids:
-            self.discard_temp_layout(layout_id)
\ No newline at end of file
+        for layout_id in list(self._idx):
+            self.discard_temp_layout(layout_id)
@@ -288,9 +288,10 @@ class WindowManager:
         with open(os.path.join(self.config_path, 'default_settings.json'), 'w') as f:
             json.dump(self.settings, f, indent=2)
         
-        # Update components with new settings
-        self.grid_overlay.settings = self.settings
-        self.grid_overlay.update()
+        # Update components with new settings; update_settings drops the
+        # overlay's derived style/marker caches, which a plain attribute
+        # assignment would leave stale
+        self.grid_overlay.update_settings(self.settings)
         if 'animation_duration' in new_settings:
             self.window_animator.set_default_duration(new_settings['animation_duration'])
 
@@ -1,5 +1,6 @@
 from dataclasses import dataclass, field
 from typing import Optional, Dict
+import time
 import uuid
 from PyQt5.QtCore import QRect
 from .window_info import WindowInfo
@@ -26,6 +27,11 @@ class AppState:
     
     # Additional properties
     custom_properties: Dict = field(default_factory=dict)
+
+    # Cached IsWindow result; see is_running
+    _alive: bool = field(default=False, init=False, repr=False)
+    _alive_checked_at: float = field(default=0.0, init=False, repr=False)
+    _alive_handle: Optional[int] = field(default=None, init=False, repr=False)
     
     @classmethod
     def from_window(cls, window_info: WindowInfo) -> 'AppState':
@@ -103,14 +109,27 @@ class AppState:
         self.requires_admin = requires_admin
     
     def is_running(self) -> bool:
-        """Check if the application is currently running."""
+        """Check if the application is currently running.
+
+        The IsWindow result is cached for 200ms: UI queries arrive many
+        times per second per app, and noticing a closed window a fifth of
+        a second late is fine. A handle change refreshes immediately.
+        """
         import win32gui
         if not self.window_handle:
             return False
-        try:
-            return win32gui.IsWindow(self.window_handle)
-        except:
-            return False
+
+        now = time.monotonic()
+        if (self.window_handle != self._alive_handle
+                or now - self._alive_checked_at >= 0.2):
+            try:
+                self._alive = bool(win32gui.IsWindow(self.window_handle))
+            except Exception:
+                self._alive = False
+            self._alive_checked_at = now
+            self._alive_handle = self.window_handle
+
+        return self._alive
     
     def matches_window(self, window_info: WindowInfo) -> bool:
         """Check if WindowInfo matches this app state."""
@@ -2,7 +2,7 @@ from dataclasses import dataclass, field
 from typing import List, Dict
 from .window_info import WindowInfo
 
-@dataclass
+@dataclass(slots=True)
 class Layer:
     """Represents a window layout configuration."""
     
@@ -15,31 +15,36 @@ class Layer:
         'subdivisions': False,
         'ultrawide_zones': None
     })
-    
+    # Handle -> WindowInfo index kept in sync by the mutators below so
+    # per-window lookups don't scan the list
+    _by_handle: Dict[int, WindowInfo] = field(default_factory=dict,
+                                              init=False, repr=False)
+
+    def __post_init__(self):
+        self._by_handle = {w.handle: w for w in self.windows}
+
     def add_window(self, window: WindowInfo):
         """Add a window to the layer."""
         # Check if window already exists
-        for existing in self.windows:
-            if existing.handle == window.handle:
-                existing.rect = window.rect
-                existing.is_pinned = window.is_pinned
-                return
+        existing = self._by_handle.get(window.handle)
+        if existing:
+            existing.rect = window.rect
+            existing.is_pinned = window.is_pinned
+            return
         self.windows.append(window)
-    
+        self._by_handle[window.handle] = window
+
     def remove_window(self, handle: int) -> bool:
         """Remove a window from the layer."""
-        for i, window in enumerate(self.windows):
-            if window.handle == handle:
-                self.windows.pop(i)
-                return True
-        return False
-    
+        window = self._by_handle.pop(handle, None)
+        if window is None:
+            return False
+        self.windows.remove(window)
+        return True
+
     def get_window(self, handle: int) -> WindowInfo:
         """Get window info by handle."""
-        for window in self.windows:
-            if window.handle == handle:
-                return window
-        return None
+        return self._by_handle.get(handle)
     
     def update_window(self, handle: int, **kwargs) -> bool:
         """Update window properties."""
@@ -55,6 +60,7 @@ class Layer:
     def clear_windows(self):
         """Remove all windows from the layer."""
         self.windows.clear()
+        self._by_handle.clear()
     
     def get_pinned_windows(self) -> List[WindowInfo]:
         """Get all pinned windows."""
@@ -39,7 +39,32 @@ class MonitorInfo:
     is_ultrawide: bool = False
     grid_config: MonitorGridConfig = field(default_factory=MonitorGridConfig)
     scale_factor: float = 1.0
-    
+    # Filled in by LayerManager.refresh_monitors so grid queries on the
+    # paint path don't rebuild the default config every call
+    default_grid_config: Optional[dict] = None
+    # (x0, y0, x1, y1) of work_area as plain ints, also filled in by
+    # refresh_monitors; hot containment tests use these instead of going
+    # through the QRect wrapper
+    bounds: Optional[Tuple[int, int, int, int]] = None
+    # Lazily cached (x, y, w, h); see work_area_tuple
+    _work_area_tuple: Optional[Tuple[int, int, int, int]] = field(
+        default=None, init=False, repr=False)
+
+    @property
+    def work_area_tuple(self) -> Tuple[int, int, int, int]:
+        """(x, y, width, height) of work_area, computed once per instance.
+
+        work_area is only ever swapped by rebuilding the MonitorInfo (on
+        profile reload or monitor refresh), so the cache can't go stale;
+        serializers reuse it instead of four Qt calls per write.
+        """
+        cached = self._work_area_tuple
+        if cached is None:
+            r = self.work_area
+            cached = (r.x(), r.y(), r.width(), r.height())
+            self._work_area_tuple = cached
+        return cached
+
     @property
     def aspect_ratio(self) -> float:
         """Calculate the monitor's aspect ratio."""
@@ -6,7 +6,7 @@ import win32con
 import win32process
 from utils.window_utils import is_valid_window
 
-@dataclass
+@dataclass(slots=True)
 class WindowInfo:
     """Information about a window's state and properties."""
     handle: int